@@ -50,7 +50,8 @@ setup(
     ],
     tests_require=[
         'pytest',
-        'freezegun',
+        'pytest-xdist==2.5.0',
+        'time-machine==2.4.0',
         'flake8',
     ],
     classifers=[
@@ -0,0 +1,4 @@
+from pathlib import Path
+
+FILES = Path(__file__).parent / 'files'
+STATIC = Path(__file__).parent.parent / 'build_magic' / 'static'
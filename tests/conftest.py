@@ -1,139 +1,164 @@
 import os
-from pathlib import Path
 import platform
+import shutil
 
 import pytest
 
+from . import FILES, STATIC
 
-@pytest.fixture
+
+def require(command):
+    """Skips the requesting test if the command isn't available on the PATH.
+
+    :param str command: The command to look for.
+    :rtype: str
+    :return: The command.
+    """
+    if shutil.which(command) is None:
+        pytest.skip(f'{command} is not available')
+    return command
+
+
+@pytest.fixture(scope='session')
 def ls():
     """Provides the correct list command for the executing operating system."""
     if platform.system() == 'Windows':
         return 'dir'
     else:
-        return 'ls'
+        return require('ls')
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def cat():
     """Provides the correct cat command for the executing operating system."""
     if platform.system() == 'Windows':
         return 'type'
     else:
-        return 'cat'
+        return require('cat')
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def cp():
     """Provides the correct file copy command for the executing operating system."""
     if platform.system() == 'Windows':
         return 'copy'
     else:
-        return 'cp'
+        return require('cp')
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def mv():
     """Provides the correct file move command for the executing operating system."""
     if platform.system() == 'Windows':
         return 'move'
     else:
-        return 'mv'
+        return require('mv')
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def touch():
     """Provides the correct touch command for the executing operating system."""
     if platform.system() == 'Windows':
         return 'type nul >>'
     else:
-        return 'touch'
+        return require('touch')
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def env():
     """Provides the correct env command for the executing operating system."""
     if platform.system() == 'Windows':
         return 'set'
     else:
-        return 'env'
+        return require('env')
 
 
 @pytest.fixture
+def restore_cwd():
+    """Restores the working directory after a test whose code under test changes it."""
+    cwd = os.getcwd()
+    yield
+    os.chdir(cwd)
+
+
+@pytest.fixture(scope='session')
+def fixture_files():
+    """Provides the contents of each file in the test files directory, keyed by file name."""
+    return {path.name: path.read_bytes() for path in FILES.iterdir() if path.is_file()}
+
+
+@pytest.fixture(scope='session')
 def magic_dir(tmp_path_factory):
-    """Provides a temporary directory for testing copy/working directory behavior."""
+    """Provides a temporary directory shared by every test in the session."""
     magic = tmp_path_factory.mktemp('build_magic')
     return magic
 
 
 @pytest.fixture
-def tmp_file(magic_dir):
-    """Provides a test file in the temp directory."""
-    hello = magic_dir / 'hello.txt'
-    hello.write_text('hello world')
-    yield magic_dir
-    os.remove('hello.txt')
+def magic_dir_fn(tmp_path_factory):
+    """Provides a new temporary directory for tests that check which files were written to it."""
+    magic = tmp_path_factory.mktemp('build_magic')
+    return magic
 
 
-@pytest.fixture
-def config_file(magic_dir):
-    """Provides a config file in the temp directory."""
+@pytest.fixture(scope='module')
+def tmp_file(tmp_path_factory):
+    """Provides a test file in a temp directory shared by the tests in a module."""
+    directory = tmp_path_factory.mktemp('tmp_file')
+    hello = directory / 'hello.txt'
+    hello.write_bytes(b'hello world')
+    return directory
+
+
+@pytest.fixture(scope='module')
+def tmp_file_str(tmp_file):
+    """Provides the path to the temp directory holding the test file as a string."""
+    return str(tmp_file)
+
+
+@pytest.fixture(scope='session')
+def config_file():
+    """Provides a config file in the test files directory."""
     if platform.system() == 'Windows':
         filename = 'config_win.yaml'
     else:
         filename = 'config.yaml'
-    config = magic_dir / filename
-    content = Path(__file__).parent.joinpath('files').joinpath(filename).read_text()
-    config.write_text(content)
-    yield config
-    os.remove(magic_dir / filename)
+    return FILES / filename
 
 
-@pytest.fixture
-def multi_config(magic_dir):
-    """Provides a config file with multiple stage in the temp directory."""
+@pytest.fixture(scope='session')
+def multi_config():
+    """Provides a config file with multiple stage in the test files directory."""
     if platform.system() == 'Windows':
         filename = 'multi_win.yaml'
     else:
         filename = 'multi.yaml'
-    config = magic_dir / filename
-    content = Path(__file__).parent.joinpath('files').joinpath(filename).read_text()
-    config.write_text(content)
-    yield config
-    os.remove(magic_dir / filename)
+    return FILES / filename
 
 
-@pytest.fixture
-def env_config(magic_dir):
-    """Provides a config file with environment variables."""
+@pytest.fixture(scope='session')
+def env_config():
+    """Provides a config file with environment variables in the test files directory."""
     if platform.system() == 'Windows':
         config_filename = 'envs_win.yaml'
     else:
         config_filename = 'envs.yaml'
-    config = magic_dir / config_filename
-    content = Path(__file__).parent.joinpath('files').joinpath(config_filename).read_text()
-    config.write_text(content)
-    yield config
-    os.remove(magic_dir / config)
+    return FILES / config_filename
 
 
-@pytest.fixture
-def multi_no_name_config(magic_dir):
-    """Provides a config file with multiple stages with no names."""
-    filename = 'multi_no_name.yaml'
-    config = magic_dir / filename
-    content = Path(__file__).parent.joinpath('files').joinpath(filename).read_text()
-    config.write_text(content)
-    yield config
-    os.remove(magic_dir / config)
+@pytest.fixture(scope='session')
+def multi_no_name_config():
+    """Provides a config file with multiple stages with no names in the test files directory."""
+    return FILES / 'multi_no_name.yaml'
 
 
-@pytest.fixture
-def labels_config(magic_dir):
-    """Provides a config file with command labels in the temp directory."""
-    filename = 'labels.yaml'
-    config = magic_dir / filename
-    content = Path(__file__).parent.joinpath('files').joinpath(filename).read_text()
-    config.write_text(content)
-    yield config
-    os.remove(magic_dir / filename)
+@pytest.fixture(scope='session')
+def labels_config():
+    """Provides a config file with command labels in the test files directory."""
+    return FILES / 'labels.yaml'
+
+
+@pytest.fixture(scope='session')
+def template_ref():
+    """Provides the contents of the config file template packaged with build-magic."""
+    return (STATIC / 'build-magic_template.yaml').read_text()
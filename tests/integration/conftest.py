@@ -2,7 +2,7 @@ from click.testing import CliRunner
 import pytest
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def cli():
     """Provides a CliRunner object for invoking cli calls."""
     return CliRunner()
@@ -18,6 +18,7 @@ from build_magic import actions
 from build_magic.exc import ContainerExistsError
 from build_magic.macro import Macro
 from build_magic.runner import CommandRunner
+from . import FILES
 
 
 @pytest.fixture
@@ -26,8 +27,8 @@ def build_path(tmp_path_factory):
     magic = tmp_path_factory.mktemp('build_magic')
     file1 = magic / 'file1.txt'
     file2 = magic / 'file2.txt'
-    file1.write_text('hello')
-    file2.write_text('world')
+    file1.write_bytes(b'hello')
+    file2.write_bytes(b'world')
     return magic
 
 
@@ -44,8 +45,8 @@ def backup_path(build_path):
     backup.mkdir()
     file1 = backup / 'file1.txt'
     file2 = backup / 'file2.txt'
-    file1.write_text('hello')
-    file2.write_text('world')
+    file1.write_bytes(b'hello')
+    file2.write_bytes(b'world')
 
 
 @pytest.fixture
@@ -241,11 +242,11 @@ def test_action_vm_destroy_delete_vagrantfile(generic_runner, mocker, tmp_path):
     """Verify the vm_destroy() function properly deletes a build-magic generated Vagrantfile."""
     mocker.patch('vagrant.Vagrant.destroy')
 
-    ref_vagrantfile = Path(__file__).parent / 'files' / 'Vagrantfile'
+    ref_vagrantfile = FILES / 'Vagrantfile'
     vagrantfile_path = tmp_path / 'vagrant_build_magic'
     vagrantfile_path.mkdir()
-    vagrantfile = ref_vagrantfile.read_text()
-    vagrantfile_path.joinpath('Vagrantfile_build_magic').write_text(vagrantfile)
+    vagrantfile = ref_vagrantfile.read_bytes()
+    vagrantfile_path.joinpath('Vagrantfile_build_magic').write_bytes(vagrantfile)
 
     assert vagrantfile_path.joinpath('Vagrantfile_build_magic').exists()
 
@@ -367,9 +368,9 @@ def test_action_container_destroy_error(generic_runner):
     assert not generic_runner.teardown()
 
 
-def test_action_capture_dir(build_hashes, build_path, generic_runner, mocker):
+def test_action_capture_dir(build_hashes, build_path, generic_runner, mocker, monkeypatch):
     """Verify the capture_dir() function works correctly."""
-    os.chdir(str(build_path))
+    monkeypatch.chdir(build_path)
     mocker.patch('build_magic.actions.container_up', return_value=True)
     # Local capture
     generic_runner.provision = types.MethodType(actions.capture_dir, generic_runner)
@@ -391,9 +392,9 @@ def test_action_capture_dir(build_hashes, build_path, generic_runner, mocker):
     assert sorted(generic_runner._existing_files) == sorted(ref)
 
 
-def test_action_capture_dir_empty(empty_path, generic_runner, mocker):
+def test_action_capture_dir_empty(empty_path, generic_runner, mocker, monkeypatch):
     """Verify the capture_dir() function works with an empty directory."""
-    os.chdir(str(empty_path))
+    monkeypatch.chdir(empty_path)
     mocker.patch('build_magic.actions.container_up', return_value=True)
     # Local capture
     generic_runner.provision = types.MethodType(actions.capture_dir, generic_runner)
@@ -409,9 +410,9 @@ def test_action_capture_dir_empty(empty_path, generic_runner, mocker):
     assert len(generic_runner._existing_files) == 0
 
 
-def test_action_capture_dir_error(build_path, generic_runner, mocker):
+def test_action_capture_dir_error(build_path, generic_runner, mocker, monkeypatch):
     """Test the case where capture_dir() raises an error."""
-    os.chdir(str(build_path))
+    monkeypatch.chdir(build_path)
     mocker.patch('build_magic.actions.container_up', return_value=True)
     # Local capture
     mocker.patch('pathlib.Path.resolve', side_effect=IsADirectoryError)
@@ -424,9 +425,9 @@ def test_action_capture_dir_error(build_path, generic_runner, mocker):
     assert not generic_runner.provision()
 
 
-def test_action_capture_dir_permission_error(build_path, generic_runner, mocker):
+def test_action_capture_dir_permission_error(build_path, generic_runner, mocker, monkeypatch):
     """Test the case where a PermissionError is raised when trying to get the hash for a file."""
-    os.chdir(str(build_path))
+    monkeypatch.chdir(build_path)
     mocker.patch('build_magic.actions.container_up', return_value=True)
     mocker.patch('pathlib.Path.read_bytes', side_effect=PermissionError)
     # Local capture
@@ -443,9 +444,10 @@ def test_action_capture_dir_permission_error(build_path, generic_runner, mocker)
     assert len(generic_runner._existing_files) == 0
 
 
-def test_action_delete_new_files(build_hashes, build_path, generic_runner, mocker):
+@pytest.mark.shell
+def test_action_delete_new_files(build_hashes, build_path, generic_runner, mocker, monkeypatch):
     """Verify the delete_new_files() function works correctly."""
-    os.chdir(str(build_path))
+    monkeypatch.chdir(build_path)
     mocker.patch('build_magic.actions.container_destroy', return_value=True)
     # Local capture
     generic_runner.teardown = types.MethodType(actions.delete_new_files, generic_runner)
@@ -465,9 +467,10 @@ def test_action_delete_new_files(build_hashes, build_path, generic_runner, mocke
     assert sorted([str(file) for file in Path.cwd().resolve().rglob('*')]) == sorted(files)
 
 
-def test_action_delete_new_files_copy(build_hashes, build_path, cp, generic_runner, mocker):
+@pytest.mark.shell
+def test_action_delete_new_files_copy(build_hashes, build_path, cp, generic_runner, mocker, monkeypatch):
     """Verify the delete_new_files() function works correctly with copies of existing files."""
-    os.chdir(str(build_path))
+    monkeypatch.chdir(build_path)
     mocker.patch('build_magic.actions.container_destroy', return_value=True)
 
     # Local capture
@@ -498,9 +501,12 @@ def test_action_delete_new_files_copy(build_hashes, build_path, cp, generic_runn
     assert sorted([str(file) for file in Path.cwd().resolve().rglob('*')]) == sorted(files)
 
 
-def test_action_delete_new_files_preserve_renamed_file(build_hashes, build_path, generic_runner, mocker, mv):
+@pytest.mark.shell
+def test_action_delete_new_files_preserve_renamed_file(
+        build_hashes, build_path, generic_runner, mocker, monkeypatch, mv
+):
     """Verify that a renamed file isn't deleted by delete_new_files()."""
-    os.chdir(str(build_path))
+    monkeypatch.chdir(build_path)
     mocker.patch('build_magic.actions.container_destroy', return_value=True)
 
     # Local capture
@@ -527,9 +533,12 @@ def test_action_delete_new_files_preserve_renamed_file(build_hashes, build_path,
     assert sorted([str(file) for file in Path.cwd().resolve().rglob('*')]) == sorted(ref_files)
 
 
-def test_action_delete_new_files_preserve_modified_file(build_hashes, build_path, generic_runner, mocker, mv):
+@pytest.mark.shell
+def test_action_delete_new_files_preserve_modified_file(
+        build_hashes, build_path, generic_runner, mocker, monkeypatch, mv
+):
     """Verify that a modified file isn't deleted by delete_new_files()."""
-    os.chdir(str(build_path))
+    monkeypatch.chdir(build_path)
     mocker.patch('build_magic.actions.container_destroy', return_value=True)
 
     # Local capture
@@ -556,9 +565,10 @@ def test_action_delete_new_files_preserve_modified_file(build_hashes, build_path
     assert sorted([str(file) for file in Path.cwd().resolve().iterdir()]) == sorted(ref_files)
 
 
-def test_action_delete_new_files_empty_directory(empty_path, generic_runner, mocker):
+@pytest.mark.shell
+def test_action_delete_new_files_empty_directory(empty_path, generic_runner, mocker, monkeypatch):
     """Verify the delete_new_files() function works correctly starting with an empty directory."""
-    os.chdir(str(empty_path))
+    monkeypatch.chdir(empty_path)
     mocker.patch('build_magic.actions.container_destroy', return_value=True)
     # Local capture
     generic_runner.teardown = types.MethodType(actions.delete_new_files, generic_runner)
@@ -579,9 +589,12 @@ def test_action_delete_new_files_empty_directory(empty_path, generic_runner, moc
     assert len([str(file) for file in Path.cwd().resolve().rglob('*')]) == 0
 
 
-def test_action_delete_new_files_empty_directory_permission_error(empty_path, generic_runner, mocker, touch):
+@pytest.mark.shell
+def test_action_delete_new_files_empty_directory_permission_error(
+        empty_path, generic_runner, mocker, monkeypatch, touch
+):
     """Test the case where delete_new_files() raises a PermissionError attempting to delete a file."""
-    os.chdir(str(empty_path))
+    monkeypatch.chdir(empty_path)
     mocker.patch('build_magic.actions.container_destroy', return_value=True)
     mocker.patch('os.remove', side_effect=PermissionError)
     # Local capture
@@ -606,9 +619,10 @@ def test_action_delete_new_files_empty_directory_permission_error(empty_path, ge
     assert len([str(file) for file in Path.cwd().resolve().rglob('*')]) == 1
 
 
-def test_action_delete_new_files_empty_directory_new_directory(empty_path, generic_runner, mocker, touch):
+@pytest.mark.shell
+def test_action_delete_new_files_empty_directory_new_directory(empty_path, generic_runner, mocker, monkeypatch, touch):
     """Verify the delete_new_files() function works correctly deleting a directory starting with an empty directory."""
-    os.chdir(str(empty_path))
+    monkeypatch.chdir(empty_path)
     mocker.patch('build_magic.actions.container_destroy', return_value=True)
     # Local capture
     generic_runner.teardown = types.MethodType(actions.delete_new_files, generic_runner)
@@ -651,9 +665,10 @@ def test_action_delete_new_files_no_existing(generic_runner, mocker):
     assert generic_runner.teardown() is False
 
 
-def test_action_delete_nested_directories(build_hashes, build_path, generic_runner, mocker, touch):
+@pytest.mark.shell
+def test_action_delete_nested_directories(build_hashes, build_path, generic_runner, mocker, monkeypatch, touch):
     """Test the case where there are several new nested directories added that need to be removed."""
-    os.chdir(str(build_path))
+    monkeypatch.chdir(build_path)
     mocker.patch('build_magic.actions.container_destroy', return_value=True)
 
     # Local capture
@@ -700,9 +715,10 @@ def test_action_delete_nested_directories(build_hashes, build_path, generic_runn
     assert len([str(file) for file in Path.cwd().resolve().rglob('*')]) == 2
 
 
-def test_action_delete_existing_empty_directory(empty_path, generic_runner, mocker, touch):
+@pytest.mark.shell
+def test_action_delete_existing_empty_directory(empty_path, generic_runner, mocker, monkeypatch, touch):
     """Test the case where a single file needs to be cleaned up in a directory with an existing empty directory."""
-    os.chdir(str(empty_path))
+    monkeypatch.chdir(empty_path)
     mocker.patch('build_magic.actions.container_destroy', return_value=True)
     generic_runner.teardown = types.MethodType(actions.delete_new_files, generic_runner)
     empty = Path('new_empty')
@@ -733,9 +749,10 @@ def test_action_delete_existing_empty_directory(empty_path, generic_runner, mock
     assert Path(remaining[0]).stem == 'new_empty'
 
 
-def test_action_delete_existing_nested_directories(generic_runner, mocker, nested_path, touch):
+@pytest.mark.shell
+def test_action_delete_existing_nested_directories(generic_runner, mocker, monkeypatch, nested_path, touch):
     """Test the case where a single file needs to be cleaned up in a directory hierarchy."""
-    os.chdir(str(nested_path))
+    monkeypatch.chdir(nested_path)
     mocker.patch('build_magic.actions.container_destroy', return_value=True)
 
     # Local capture
@@ -762,9 +779,10 @@ def test_action_delete_existing_nested_directories(generic_runner, mocker, neste
         assert str(file) in dirs
 
 
-def test_action_delete_dir_ignore_git(build_path, git_path, generic_runner, mocker, touch):
+@pytest.mark.shell
+def test_action_delete_dir_ignore_git(build_path, generic_runner, git_path, mocker, monkeypatch, touch):
     """Test the case where the a new file added to a .git directory isn't deleted."""
-    os.chdir(str(build_path))
+    monkeypatch.chdir(build_path)
     mocker.patch('build_magic.actions.container_destroy', return_value=True)
 
     # Local capture
@@ -789,9 +807,9 @@ def test_action_delete_dir_ignore_git(build_path, git_path, generic_runner, mock
     assert Path().cwd().joinpath('file3.txt').exists() is False
 
 
-def test_action_backup_dir(build_path, generic_runner):
+def test_action_backup_dir(build_path, generic_runner, monkeypatch):
     """Verify the backup_dir() function works correctly."""
-    os.chdir(str(build_path))
+    monkeypatch.chdir(build_path)
     generic_runner.provision = types.MethodType(actions.backup_dir, generic_runner)
     assert generic_runner.provision()
     assert build_path.joinpath(actions.BACKUP_PATH).exists()
@@ -799,9 +817,9 @@ def test_action_backup_dir(build_path, generic_runner):
     assert len(list(build_path.joinpath(actions.BACKUP_PATH).iterdir())) == 2
 
 
-def test_action_backup_dir_empty_directory(empty_path, generic_runner):
+def test_action_backup_dir_empty_directory(empty_path, generic_runner, monkeypatch):
     """Test the case where backup_dir() is called on an empty directory."""
-    os.chdir(str(empty_path))
+    monkeypatch.chdir(empty_path)
     generic_runner.provision = types.MethodType(actions.backup_dir, generic_runner)
     assert generic_runner.provision()
     assert empty_path.joinpath(actions.BACKUP_PATH).exists()
@@ -809,17 +827,17 @@ def test_action_backup_dir_empty_directory(empty_path, generic_runner):
     assert len(list(empty_path.joinpath(actions.BACKUP_PATH).iterdir())) == 0
 
 
-def test_action_backup_dir_error(build_path, generic_runner, mocker):
+def test_action_backup_dir_error(build_path, generic_runner, mocker, monkeypatch):
     """Test the case where backup_dir() raises an error."""
     mocker.patch('shutil.copytree', side_effect=PermissionError)
-    os.chdir(str(build_path))
+    monkeypatch.chdir(build_path)
     generic_runner.provision = types.MethodType(actions.backup_dir, generic_runner)
     assert not generic_runner.provision()
 
 
-def test_action_backup_dir_backup_exists(build_path, generic_runner):
+def test_action_backup_dir_backup_exists(build_path, generic_runner, monkeypatch):
     """Test the case where a backup directory already exists when backup_dir() is called."""
-    os.chdir(str(build_path))
+    monkeypatch.chdir(build_path)
     generic_runner.provision = types.MethodType(actions.backup_dir, generic_runner)
     backup = build_path.joinpath(actions.BACKUP_PATH)
     backup.mkdir()
@@ -1,231 +1,285 @@
 """This module hosts unit tests for the cli."""
 
-import os
-from pathlib import Path
 import platform
+import re
 import sys
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, Mock
 
+import click
 from click.testing import CliRunner
-from docker.errors import ImageNotFound
-import paramiko
 import pytest
 from yaml.composer import ComposerError
 
 from build_magic import __version__ as version
-from build_magic.cli import build_magic
 from build_magic.exc import DockerDaemonError
 from build_magic.reference import ExitCode
+from . import FILES
 
 
-USAGE = """Usage: build-magic [OPTIONS] [ARGS]...
+USAGE_LINE = 'Usage: build-magic [OPTIONS] [ARGS]...'
 
-build-magic is an un-opinionated build automation tool. Some potential uses include:
-    * Building applications across multiple platforms.
-    * Conducting installation dry runs.
-    * Automating repeated tasks.
-    * Deploying and installing artifacts to remote machines.
 
-Examples:
-* Archive two files on the local machine.
-    build-magic tar -czf myfiles.tar.gz file1.txt file2.txt
+NO_OPTIONS_REF = (
+    'build-magic is an un-opinionated build automation tool.',
+    'Use --help for detailed usage of each option.',
+)
 
-* Archive two files on the local machine and delete the original files.
-    build-magic -c build "tar -czf myfiles.tar.gz file1.txt file2.txt" -c execute "rm file1.txt file2.txt"
 
-* Copy two files to a remote machine and archive them.
-    build-magic -r remote -e user@myhost --copy . -c build "tar -czf myfiles.tar.gz f1.txt f2.txt" f1.txt f2.txt
+HELP_REF = (
+    'An un-opinionated build automation tool.',
+    'Options:',
+    '--help                          Show this message and exit.',
+)
 
-* Build a project in a Linux container.
-    build-magic -r docker -e ubuntu:latest -c execute "configure" -c build "make all"
 
-* Execute multiple commands in a config file.
-    build-magic -C myconfig.yaml
+HELP_OPTIONS = (
+    '--command', '--config', '--copy', '--environment', '--runner', '--wd', '--continue / --stop', '--name',
+    '--description', '--target', '--skip', '--info', '--export', '--env', '--dotenv', '--template', '--parameter',
+    '--variable', '--validate', '--prompt', '--action', '--plain', '--fancy', '--quiet', '--verbose', '--version',
+)
 
-* Execute a particular stage in a config file.
-    build-magic -C myconfig.yaml -t build
 
-* Execute a particular stage in a config file in the current directory named build-magic.yaml.
-    build-magic build
+INVALID_RUNNER = "Invalid value for '--runner' / '-r': 'dummy' is not one of 'local', 'remote', 'vagrant', 'docker'."
 
-* Execute all stages in a config file in the current directory named build-magic.yaml.
-    build-magic all
 
-Use --help for detailed usage of each option.
+DOCKER_MISSING_ENVIRONMENT = """Environment must be a Docker image if using the Docker runner.
+"""
 
-Visit https://cmmorrow.github.io/build-magic/user_guide/cli_usage/ for a detailed usage description.
 
+VAGRANT_MISSING_ENVIRONMENT = """Environment must be a path to a Vagrant file if using the Vagrant runner.
 """
 
 
-@pytest.fixture
+NO_COMMANDS = """There are no commands to execute.
+"""
+
+
+INVALID_PARAMETER = """Parameter dummy is not a valid parameter.
+"""
+
+
+INVALID_PARAMETER_VALUE = "Validation failed: Value dummy is not one of "
+
+
+if sys.platform == 'linux':
+    CP_ERRORS = ('cp: missing file operand',)
+elif sys.platform == 'win32':
+    CP_ERRORS = ('The syntax of the command is incorrect.',)
+else:
+    CP_ERRORS = ('usage: cp', 'cp: missing file operand')
+
+
+STAGE1_DONE = 'Stage 1: test stage - finished with result DONE'
+
+
+STAGE1_SKIPPED = 'Stage 1 finished with result SKIPPED'
+
+
+CONFIG_MULTI_MARKERS = (
+    'Starting Stage 1: Test stage',
+    'Starting Stage 2: Stage A',
+    'Starting Stage 3: Stage B',
+    'Stage 1: Test stage - finished with result DONE',
+    'Stage 2: Stage A - finished with result DONE',
+    'Stage 3: Stage B - finished with result DONE',
+)
+
+
+CONFIG_MULTI_PATTERN = re.compile('|'.join(map(re.escape, CONFIG_MULTI_MARKERS)))
+
+
+PLAIN_FANCY_ARGS = (
+    ('--plain', '--fancy', 'echo hello world'),
+    ('--fancy', '--plain', 'echo hello world'),
+)
+
+
+PLAIN_QUIET_ARGS = (
+    ('--plain', '--quiet', 'echo hello world'),
+    ('--quiet', '--plain', 'echo hello world'),
+)
+
+
+FANCY_QUIET_ARGS = (
+    ('--fancy', '--quiet', 'echo hello world'),
+    ('--quiet', '--fancy', 'echo hello world'),
+)
+
+
+FANCY_PLAIN_QUIET_ARGS = (
+    ('--fancy', '--plain', '--quiet', 'echo hello world'),
+    ('--plain', '--quiet', '--fancy', 'echo hello world'),
+    ('--quiet', '--fancy', '--plain', 'echo hello world'),
+    ('--fancy', '--quiet', '--plain', 'echo hello world'),
+    ('--quiet', '--plain', '--fancy', 'echo hello world'),
+    ('--plain', '--fancy', '--quiet', 'echo hello world'),
+)
+
+
+@pytest.fixture(scope='session')
+def build_magic_cmd():
+    """Provides the build-magic command, imported only once a test needs it."""
+    from build_magic.cli import build_magic
+
+    return build_magic
+
+
+@pytest.fixture(scope='session')
+def invoke_fast(build_magic_cmd, cli):
+    """Provides a function that invokes build-magic in a CliRunner's isolation without CliRunner.invoke."""
+    def invoke(args):
+        """Invokes build-magic with the given arguments.
+
+        :param list args: The command line arguments to pass to build-magic.
+        :rtype: tuple[int, str]
+        :return: The exit code and the text written to stdout and stderr.
+        """
+        with cli.isolation() as (out, _):
+            code = build_magic_cmd.main(args, prog_name='build-magic', standalone_mode=False)
+        return code, out.getvalue().decode()
+
+    return invoke
+
+
+@pytest.fixture(scope='session')
 def cli():
     """Provides a CliRunner object for invoking cli calls."""
     return CliRunner()
 
 
+@pytest.fixture(scope='session')
+def help_output(build_magic_cmd, cli):
+    """Provides the result of invoking build-magic with the --help option."""
+    return cli.invoke(build_magic_cmd, ['--help'])
+
+
 @pytest.fixture
-def current_file(magic_dir):
-    """Provides a test file in the current directory."""
-    current = Path().cwd().resolve()
-    hello = current / 'hello.txt'
-    hello.write_text('hello world')
-    yield magic_dir
-    os.chdir(str(current))
-    os.remove('hello.txt')
+def fast_local(mocker):
+    """Replaces command execution by the local runner with a successful echo of hello world."""
+    from build_magic.runner import Status
+
+    return mocker.patch('build_magic.runner.Local.execute', return_value=Status(b'hello world\n', b'', 0))
 
 
 @pytest.fixture
-def targets_config(magic_dir):
-    """Provides a config file for testing multiple targets in the temp directory."""
-    filename = 'targets.yaml'
-    config = magic_dir / filename
-    content = Path(__file__).parent.joinpath('files').joinpath(filename).read_text()
-    config.write_text(content)
-    yield config
-    os.remove(magic_dir / filename)
+def mocked_ssh(mocker):
+    """Replaces the SSH connection used by the remote runner with one that successfully echoes hello."""
+    import paramiko
+
+    mocker.patch('paramiko.ECDSAKey.from_private_key_file')
+    mocker.patch('build_magic.runner.Remote.connect', return_value=paramiko.SSHClient)
+    mocker.patch('paramiko.SSHClient.close')
+    return mocker.patch(
+        'paramiko.SSHClient.exec_command',
+        return_value=(
+            None,
+            Mock(readlines=lambda: 'hello', channel=Mock(recv_exit_status=lambda: 0)),
+            Mock(readlines=lambda: '')
+        )
+    )
+
+
+@pytest.fixture(scope='module')
+def current_file(tmp_path_factory):
+    """Provides a test file to copy to the working directory."""
+    hello = tmp_path_factory.mktemp('current_file') / 'hello.txt'
+    hello.write_bytes(b'hello world')
+    return hello
+
+
+@pytest.fixture(scope='session')
+def targets_config():
+    """Provides a config file for testing multiple targets in the test files directory."""
+    return FILES / 'targets.yaml'
+
+
+@pytest.fixture
+def cwd_config(fixture_files, monkeypatch, tmp_path):
+    """Provides a function that writes a test file to a temporary current directory."""
+    monkeypatch.chdir(tmp_path)
+
+    def write(source, filename=None):
+        config = tmp_path / (filename or source)
+        config.write_bytes(fixture_files[source])
+        return config
+
+    return write
 
 
 @pytest.fixture
-def default_config():
+def default_config(cwd_config):
     """Provides a default config file in the current directory."""
-    filename = 'build-magic.yaml'
-    current = Path().cwd().resolve()
-    config = current / filename
-    content = Path(__file__).parent.joinpath('files').joinpath(filename).read_text()
-    config.write_text(content)
-    yield config
-    os.remove(config)
+    return cwd_config('build-magic.yaml')
 
 
 @pytest.fixture
-def second_default(magic_dir):
+def second_default(cwd_config):
     """Provides an additional default config as an alternative."""
-    filename = 'build-magic.yml'
-    current = Path().cwd().resolve()
-    config = current / filename
-    content = Path(__file__).parent.joinpath('files').joinpath('build-magic.yaml').read_text()
-    config.write_text(content)
-    yield magic_dir
-    os.chdir(str(current))
-    os.remove(filename)
+    return cwd_config('build-magic.yaml', 'build-magic.yml')
 
 
-@pytest.fixture
-def invalid_config(magic_dir):
-    """Provides an invalid config file."""
-    filename = 'invalid.yaml'
-    config = magic_dir / filename
-    content = Path(__file__).parent.joinpath('files').joinpath(filename).read_text()
-    config.write_text(content)
-    yield config
-    os.remove(magic_dir / filename)
+@pytest.fixture(scope='session')
+def invalid_config():
+    """Provides an invalid config file in the test files directory."""
+    return FILES / 'invalid.yaml'
 
 
 @pytest.fixture
-def variable_and_default_config(default_config, magic_dir, variables_config):
+def variable_and_default_config(cwd_config, default_config):
     """Provides a default and variable config file in the current directory."""
-    filename = variables_config.name
-    current = Path().cwd().resolve()
-    config = current / filename
-    content = variables_config.read_text()
-    config.write_text(content)
-    yield magic_dir
-    os.remove(current / filename)
+    return cwd_config('variables.yaml')
 
 
 @pytest.fixture
-def prompt_and_default_config(default_config, magic_dir, prompt_config):
+def prompt_and_default_config(cwd_config, default_config):
     """Provides a default and prompt config file in the current directory."""
-    filename = prompt_config.name
-    current = Path().cwd().resolve()
-    config = current / filename
-    content = prompt_config.read_text()
-    config.write_text(content)
-    yield magic_dir
-    os.chdir(str(current))
-    os.remove(filename)
+    return cwd_config('prompt.yaml')
 
 
-@pytest.fixture
-def parameters_config(magic_dir):
-    """Provides a config file with parameters in the temp directory."""
-    filename = 'parameters.yaml'
-    config = magic_dir / filename
-    content = Path(__file__).parent.joinpath('files').joinpath(filename).read_text()
-    config.write_text(content)
-    yield config
-    os.remove(magic_dir / filename)
+@pytest.fixture(scope='session')
+def parameters_config():
+    """Provides a config file with parameters in the test files directory."""
+    return FILES / 'parameters.yaml'
 
 
-@pytest.fixture
-def variables_config(magic_dir):
-    """Provides a config file for testing variable substitution in the temp directory."""
-    filename = 'variables.yaml'
-    config = magic_dir / filename
-    content = Path(__file__).parent.joinpath('files').joinpath(filename).read_text()
-    config.write_text(content)
-    yield config
-    os.remove(magic_dir / filename)
+@pytest.fixture(scope='session')
+def variables_config():
+    """Provides a config file for testing variable substitution in the test files directory."""
+    return FILES / 'variables.yaml'
 
 
-@pytest.fixture
-def prompt_config(magic_dir):
-    """Provides a config file with a prompt for variable input in the temp directory."""
-    filename = 'prompt.yaml'
-    config = magic_dir / filename
-    content = Path(__file__).parent.joinpath('files').joinpath(filename).read_text()
-    config.write_text(content)
-    yield config
-    os.remove(magic_dir / filename)
+@pytest.fixture(scope='session')
+def prompt_config():
+    """Provides a config file with a prompt for variable input in the test files directory."""
+    return FILES / 'prompt.yaml'
 
 
-@pytest.fixture
-def prepare_config(magic_dir):
-    """Provides a config file with a prepare section in the temp directory."""
-    filename = 'prepare.yaml'
-    config = magic_dir / filename
-    content = Path(__file__).parent.joinpath('files').joinpath(filename).read_text()
-    config.write_text(content)
-    yield config
-    os.remove(magic_dir / filename)
+@pytest.fixture(scope='session')
+def prepare_config():
+    """Provides a config file with a prepare section in the test files directory."""
+    return FILES / 'prepare.yaml'
 
 
-@pytest.fixture
-def meta_config(magic_dir):
-    """Provides a config file with meta data in the temp directory."""
-    filename = 'meta.yaml'
-    config = magic_dir / filename
-    content = Path(__file__).parent.joinpath('files').joinpath(filename).read_text()
-    config.write_text(content)
-    yield config
-    os.remove(magic_dir / filename)
+@pytest.fixture(scope='session')
+def meta_config():
+    """Provides a config file with meta data in the test files directory."""
+    return FILES / 'meta.yaml'
 
 
-@pytest.fixture
-def skip1_config(magic_dir):
-    """Provides a config file with one stage to skip in the temp directory."""
-    filename = 'skip1.yaml'
-    config = magic_dir / filename
-    content = Path(__file__).parent.joinpath('files').joinpath(filename).read_text()
-    config.write_text(content)
-    yield config
-    os.remove(magic_dir / filename)
+@pytest.fixture(scope='session')
+def skip1_config():
+    """Provides a config file with one stage to skip in the test files directory."""
+    return FILES / 'skip1.yaml'
 
 
-@pytest.fixture
-def skip1fail_config(magic_dir):
-    """Provides a config file with one stage to skip and a second to fail in the temp directory."""
-    filename = 'skip1fail.yaml'
-    config = magic_dir / filename
-    content = Path(__file__).parent.joinpath('files').joinpath(filename).read_text()
-    config.write_text(content)
-    yield config
-    os.remove(magic_dir / filename)
+@pytest.fixture(scope='session')
+def skip1fail_config():
+    """Provides a config file with one stage to skip and a second to fail in the test files directory."""
+    return FILES / 'skip1fail.yaml'
 
 
 @pytest.fixture
-def env_and_dotenv_config(magic_dir):
+def env_and_dotenv_config(fixture_files, tmp_path):
     """Provides a config file with environment variables and dotenv file."""
     if platform.system() == 'Windows':
         config_filename = 'envs_win.yaml'
@@ -233,22 +287,16 @@ def env_and_dotenv_config(magic_dir):
         config_filename = 'envs.yaml'
     dotenv_filename = 'test.env'
 
-    config = magic_dir / config_filename
-    dotenv = magic_dir / dotenv_filename
-
-    content = Path(__file__).parent.joinpath('files').joinpath(config_filename).read_text()
-    config.write_text(content)
+    config = tmp_path / config_filename
+    dotenv = tmp_path / dotenv_filename
 
-    content = Path(__file__).parent.joinpath('files').joinpath(dotenv_filename).read_text()
-    dotenv.write_text(content)
-
-    yield magic_dir
-    os.remove(magic_dir / config)
-    os.remove(magic_dir / dotenv)
+    config.write_bytes(fixture_files[config_filename])
+    dotenv.write_bytes(fixture_files[dotenv_filename])
+    return tmp_path
 
 
 @pytest.fixture
-def dotenv_config(magic_dir):
+def dotenv_config(fixture_files, tmp_path):
     """Provides a config file that uses a dotenv file in the temp directory."""
     if platform.system() == 'Windows':
         config_filename = 'dotenv_win.yaml'
@@ -256,472 +304,383 @@ def dotenv_config(magic_dir):
         config_filename = 'dotenv.yaml'
     dotenv_filename = 'test.env'
 
-    config = magic_dir / config_filename
-    dotenv = magic_dir / dotenv_filename
-
-    content = Path(__file__).parent.joinpath('files').joinpath(config_filename).read_text()
-    config.write_text(content)
-
-    content = Path(__file__).parent.joinpath('files').joinpath(dotenv_filename).read_text()
-    dotenv.write_text(content)
+    config = tmp_path / config_filename
+    dotenv = tmp_path / dotenv_filename
 
-    yield magic_dir
-    os.remove(magic_dir / config)
-    os.remove(magic_dir / dotenv)
+    config.write_bytes(fixture_files[config_filename])
+    dotenv.write_bytes(fixture_files[dotenv_filename])
+    return tmp_path
 
 
-def test_cli_no_options(cli):
+def test_cli_no_options(build_magic_cmd, cli):
     """Verify that the usage is printed when no options or arguments are provided."""
-    res = cli.invoke(build_magic)
+    res = cli.invoke(build_magic_cmd)
     assert res.exit_code == ExitCode.NO_TESTS
-    assert res.output == USAGE
+    assert res.output.startswith(USAGE_LINE)
+    for line in NO_OPTIONS_REF:
+        assert line in res.output
 
 
-def test_cli_help(cli):
+def test_cli_help(help_output):
     """Verify the help is displayed when given the --help option."""
-    ref = """Usage: build-magic [OPTIONS] [ARGS]...
-
-  An un-opinionated build automation tool.
-
-  ARGS - One of four possible uses based on context:
-
-  1. If the --copy option is used, each argument in ARGS is a file name in the
-  copy from directory to copy to the working directory.
-
-  2. If there is a config file named build-magic.yaml in the working directory,
-  ARGS is the name of a stage to execute.
-
-  3. ARGS are considered a single command to execute if the --command option
-  isn't used.
-
-  4. ARGS are config file names if using the --info option.
-
-  Visit https://cmmorrow.github.io/build-magic/user_guide/cli_usage/ for a
-  detailed usage description.
-
-Options:
-  -c, --command <TEXT TEXT>...    A directive, command pair to execute.
-  -C, --config FILENAME           The config file to load parameters from.
-  --copy TEXT                     Copy files from the specified path.
-  -e, --environment TEXT          The command runner environment to use.
-  -r, --runner [local|remote|vagrant|docker]
-                                  The command runner to use.
-  --wd DIRECTORY                  The working directory to run commands from.
-  --continue / --stop             Continue to run after failure if True.
-  --name TEXT                     The stage name to use.
-  --description TEXT              The stage description to use.
-  -t, --target TEXT               Run a particular stage in a config file by
-                                  name.
-  -s, --skip TEXT                 Skip the specified stage.
-  --info                          Display config file metadata, variables, and
-                                  stage names.
-  --export <TEXT TEXT>...         Export a Config File to GitHub Actions or
-                                  GitLab CI.
-  --env <TEXT TEXT>...            Provide an environment variable to set for
-                                  stage execution.
-  --dotenv FILENAME               Provide a dotenv file to set additional
-                                  environment variables.
-  --template                      Generates a config file template in the
-                                  current directory.
-  -p, --parameter <TEXT TEXT>...  Space separated key/value used for runner
-                                  specific settings.
-  -v, --variable <TEXT TEXT>...   Space separated key/value config file
-                                  variables.
-  --validate FILENAME             Validate a config file by name.
-  --prompt TEXT                   Config file variable with prompt for value.
-  --action [default|cleanup|persist]
-                                  The setup and teardown action to perform.
-  --plain                         Enables basic output. Ideal for logging and
-                                  automation.
-  --fancy                         Enables output with colors. Ideal for an
-                                  interactive terminal session.
-  --quiet                         Suppresses all output from build-magic.
-  --verbose                       Verbose output -- stdout from executed
-                                  commands will be printed when complete.
-  --version                       Show the version and exit.
-  --help                          Show this message and exit.
-"""
-    res = cli.invoke(build_magic, ['--help'])
-    assert res.exit_code == ExitCode.PASSED
-    assert res.output == ref
+    assert help_output.exit_code == ExitCode.PASSED
+    assert help_output.output.startswith(USAGE_LINE)
+    for line in HELP_REF:
+        assert line in help_output.output
+    for option in HELP_OPTIONS:
+        assert option in help_output.output
 
 
-def test_cli_single_command(cli):
+@pytest.mark.usefixtures('fast_local')
+def test_cli_single_command(build_magic_cmd, cli):
     """Verify passing a single single command as arguments works correctly."""
-    res = cli.invoke(build_magic, ['echo hello world'])
+    res = cli.invoke(build_magic_cmd, ['echo hello world'])
     out = res.output
     assert res.exit_code == ExitCode.PASSED
     assert 'Starting Stage 1' in out
     assert '=> Current working directory: .' in out
 
 
-def test_cli_multiple_commands(cli, ls):
+@pytest.mark.usefixtures('fast_local')
+@pytest.mark.parametrize('option', ('-c', '--command'))
+def test_cli_multiple_commands(invoke_fast, ls, option):
     """Verify passing multiple commands with the -c and --command options works correctly."""
-    res = cli.invoke(build_magic, ['-c', 'execute', 'echo hello world', '-c', 'execute', f'{ls}'])
-    assert res.exit_code == ExitCode.PASSED
+    code, _ = invoke_fast([option, 'execute', 'echo hello world', option, 'execute', f'{ls}'])
+    assert code == ExitCode.PASSED
 
-    res = cli.invoke(build_magic, ['--command', 'execute', 'echo hello world', '--command', 'execute', f'{ls}'])
-    assert res.exit_code == ExitCode.PASSED
 
-
-def test_cli_runner(cli, ls):
+@pytest.mark.usefixtures('fast_local')
+@pytest.mark.parametrize('option', ('-r', '--runner'))
+def test_cli_runner(invoke_fast, ls, option):
     """Verify the local runner is used with -r and --runner options works correctly."""
-    res = cli.invoke(build_magic, ['-r', 'local', f'{ls}'])
-    assert res.exit_code == ExitCode.PASSED
-
-    res = cli.invoke(build_magic, ['--runner', 'local', f'{ls}'])
-    assert res.exit_code == ExitCode.PASSED
+    code, _ = invoke_fast([option, 'local', f'{ls}'])
+    assert code == ExitCode.PASSED
 
 
-def test_cli_stage_name(cli):
+@pytest.mark.usefixtures('fast_local')
+def test_cli_stage_name(build_magic_cmd, cli):
     """Verify the stage --name option works as expected."""
-    res = cli.invoke(build_magic, ['--name', 'test stage', 'echo hello'])
+    res = cli.invoke(build_magic_cmd, ['--name', 'test stage', 'echo hello'])
     assert res.exit_code == ExitCode.PASSED
     assert 'Starting Stage 1: test stage' in res.output
-    assert 'Stage 1: test stage - finished with result COMPLETE'
+    assert STAGE1_DONE in res.output
 
-    res = cli.invoke(build_magic, ['--name', 'test stage', '-c', 'execute', 'echo hello'])
+    res = cli.invoke(build_magic_cmd, ['--name', 'test stage', '-c', 'execute', 'echo hello'])
     assert res.exit_code == ExitCode.PASSED
     assert 'Starting Stage 1: test stage' in res.output
-    assert 'Stage 1: test stage - finished with result COMPLETE'
+    assert STAGE1_DONE in res.output
 
 
-def test_cli_description(cli):
+@pytest.mark.usefixtures('fast_local')
+def test_cli_description(build_magic_cmd, cli):
     """Verify providing a description works correctly."""
-    res = cli.invoke(build_magic, ['--description', 'This is a test', 'echo hello world'])
+    res = cli.invoke(build_magic_cmd, ['--description', 'This is a test', 'echo hello world'])
     out = res.output
     assert res.exit_code == ExitCode.PASSED
     assert 'Starting Stage 1 - This is a test' in out
 
 
-def test_cli_name_and_description(cli):
+@pytest.mark.usefixtures('fast_local')
+def test_cli_name_and_description(build_magic_cmd, cli):
     """Verify providing a name and description works correctly."""
-    res = cli.invoke(build_magic, ['--name', 'test', '--description', 'This is a test', 'echo hello world'])
+    res = cli.invoke(build_magic_cmd, ['--name', 'test', '--description', 'This is a test', 'echo hello world'])
     out = res.output
     assert res.exit_code == ExitCode.PASSED
     assert 'Starting Stage 1: test - This is a test' in out
 
 
-def test_cli_invalid_runner(cli):
+def test_cli_invalid_runner(build_magic_cmd):
     """Test the case where an invalid command runner is provided."""
-    ref = """Usage: build-magic [OPTIONS] [ARGS]...
-Try 'build-magic --help' for help.
-
-Error: Invalid value for '--runner' / '-r': 'dummy' is not one of 'local', 'remote', 'vagrant', 'docker'.
-"""
-    res = cli.invoke(build_magic, ['-r', 'dummy', 'ls'])
-    assert res.exit_code == ExitCode.INPUT_ERROR
-    assert res.output == ref
+    with pytest.raises(click.exceptions.BadParameter) as err:
+        build_magic_cmd.make_context('build-magic', ['-r', 'dummy', 'ls'])
+    assert err.value.exit_code == ExitCode.INPUT_ERROR
+    assert err.value.format_message() == INVALID_RUNNER
 
 
-def test_cli_docker_missing_environment(cli):
+def test_cli_docker_missing_environment(invoke_fast):
     """Test the case where the docker runner is called without the environment option."""
-    ref = """Environment must be a Docker image if using the Docker runner.
-"""
-    res = cli.invoke(build_magic, ['-r', 'docker', 'ls'])
-    assert res.exit_code == ExitCode.INPUT_ERROR
-    assert res.output == ref
+    code, out = invoke_fast(['-r', 'docker', 'ls'])
+    assert code == ExitCode.INPUT_ERROR
+    assert out == DOCKER_MISSING_ENVIRONMENT
 
 
-def test_cli_docker_environment_not_found(cli, mocker):
+def test_cli_docker_environment_not_found(build_magic_cmd, cli, mocker):
     """Test the case where the requested image is not found."""
+    from docker.errors import ImageNotFound
+
     mocker.patch('docker.client.DockerClient.containers', new_callable=mocker.PropertyMock)
     mocker.patch('docker.client.DockerClient.containers.list', return_value=[])
     mocker.patch('docker.client.DockerClient.containers.run', side_effect=ImageNotFound('Not Found'))
-    res = cli.invoke(build_magic, ['-r', 'docker', '-e', 'centos:7', 'echo', '"hello world"'])
+    res = cli.invoke(build_magic_cmd, ['-r', 'docker', '-e', 'centos:7', 'echo', '"hello world"'])
     assert 'Setup failed: Not Found' in res.output
 
 
-def test_cli_docker_container_already_running(cli, mocker):
+def test_cli_docker_container_already_running(build_magic_cmd, cli, mocker):
     """Test the case where a build-magic container is already running."""
     mocker.patch('docker.client.DockerClient.containers', new_callable=mocker.PropertyMock)
     mocker.patch('docker.client.DockerClient.containers.list', return_value=[MagicMock])
-    res = cli.invoke(build_magic, ['-r', 'docker', '-e', 'centos:7', 'echo', '"hello world"'])
+    res = cli.invoke(build_magic_cmd, ['-r', 'docker', '-e', 'centos:7', 'echo', '"hello world"'])
     assert 'Setup failed: A build-magic container is already running.' in res.output
 
 
-def test_cli_docker_not_found(cli, mocker):
+def test_cli_docker_not_found(build_magic_cmd, cli, mocker):
     """Test the case where Docker isn't running or isn't installed."""
     mocker.patch('docker.from_env', side_effect=DockerDaemonError)
-    res = cli.invoke(build_magic, ['-r', 'docker', '-e', 'alpine:latest', 'echo', '"hello world"'])
+    res = cli.invoke(build_magic_cmd, ['-r', 'docker', '-e', 'alpine:latest', 'echo', '"hello world"'])
     assert 'Setup failed: Cannot connect to Docker daemon. Is Docker installed and running?' in res.output
 
 
-def test_cli_docker_hostwd_not_found(cli, mocker):
+def test_cli_docker_hostwd_not_found(build_magic_cmd, cli, mocker):
     """Test the case where the hostwd doesn't exist."""
     mocker.patch('pathlib.Path.exists', return_value=False)
-    res = cli.invoke(build_magic, ['-p', 'hostwd', 'fake', '-r', 'docker', '-e', 'alpine:latest', 'echo', 'hello'])
+    res = cli.invoke(build_magic_cmd, ['-p', 'hostwd', 'fake', '-r', 'docker', '-e', 'alpine:latest', 'echo', 'hello'])
     assert res.output == 'The host working directory was not found.\n'
     assert res.exit_code == ExitCode.INPUT_ERROR.value
 
 
-def test_cli_vagrant_not_found(cli, mocker):
+def test_cli_vagrant_not_found(build_magic_cmd, cli, mocker):
     """Test the case where Vagrant isn't found or installed."""
     mocker.patch('vagrant.which', return_value=None)
     mocker.patch('pathlib.Path.exists', return_value=True)
-    res = cli.invoke(build_magic, ['-r', 'vagrant', '-e', 'files/Vagrantfile', 'echo', '"hello world"'])
+    res = cli.invoke(build_magic_cmd, ['-r', 'vagrant', '-e', 'files/Vagrantfile', 'echo', '"hello world"'])
     assert 'The Vagrant executable cannot be found. Please check if it is in the system path.' in res.output
 
 
-def test_cli_vagrant_hostwd_not_found(cli, mocker):
+def test_cli_vagrant_hostwd_not_found(build_magic_cmd, cli, mocker):
     """Test the case where the hostwd doesn't exist."""
     mocker.patch('pathlib.Path.exists', return_value=False)
-    res = cli.invoke(build_magic, ['-r', 'vagrant', '-e', 'fake/Vagrantfile', 'echo', '"hello world"'])
+    res = cli.invoke(build_magic_cmd, ['-r', 'vagrant', '-e', 'fake/Vagrantfile', 'echo', '"hello world"'])
     assert res.output == 'The host working directory was not found.\n'
     assert res.exit_code == ExitCode.INPUT_ERROR.value
 
 
-def test_cli_vagrant_missing_environment(cli):
+def test_cli_vagrant_missing_environment(invoke_fast):
     """Test the case where the vagrant runner is called without the environment option."""
-    ref = """Environment must be a path to a Vagrant file if using the Vagrant runner.
-"""
-    res = cli.invoke(build_magic, ['-r', 'vagrant', 'ls'])
-    assert res.exit_code == ExitCode.INPUT_ERROR
-    assert res.output == ref
+    code, out = invoke_fast(['-r', 'vagrant', 'ls'])
+    assert code == ExitCode.INPUT_ERROR
+    assert out == VAGRANT_MISSING_ENVIRONMENT
 
 
-def test_cli_empty_string_command(cli):
+def test_cli_empty_string_command(invoke_fast):
     """Test the case where the command provided is an empty string."""
-    ref = """There are no commands to execute.
-"""
-    res = cli.invoke(build_magic, ['-c', 'execute', ''])
-    assert res.exit_code == ExitCode.INPUT_ERROR
-    assert res.output == ref
+    code, out = invoke_fast(['-c', 'execute', ''])
+    assert code == ExitCode.INPUT_ERROR
+    assert out == NO_COMMANDS
 
 
-def test_cli_artifacts_but_empty_string_command(cli):
+@pytest.mark.shell
+def test_cli_artifacts_but_empty_string_command(invoke_fast):
     """Test the case where artifacts are provided as arguments but with no command."""
-    res = cli.invoke(build_magic, ['blah', 'file2.txt'])
-    assert res.exit_code == ExitCode.FAILED
+    code, _ = invoke_fast(['blah', 'file2.txt'])
+    assert code == ExitCode.FAILED
 
 
-def test_cli_options_no_command(cli):
+def test_cli_options_no_command(invoke_fast):
     """Test the case where options are provided without a command."""
-    res = cli.invoke(build_magic, ['--verbose', '--plain'])
-    assert res.exit_code == ExitCode.NO_TESTS
-
-
-def test_cli_verbose_output(cli):
+    code, _ = invoke_fast(['--verbose', '--plain'])
+    assert code == ExitCode.NO_TESTS
+
+
+@pytest.mark.usefixtures('fast_local')
+@pytest.mark.parametrize(
+    ('options', 'ref'),
+    [
+        (['--verbose', '--plain'], '[ INFO  ] OUTPUT: hello world'),
+        (['--verbose'], 'OUTPUT: hello world'),
+        (['--verbose', '--fancy'], 'OUTPUT: hello world'),
+    ]
+)
+def test_cli_verbose_output(build_magic_cmd, cli, options, ref):
     """Verify the --verbose option works correctly."""
-    ref = """[ INFO  ] OUTPUT: hello world"""
-    res = cli.invoke(build_magic, ['--verbose', '--plain', 'echo hello world'])
-    assert res.exit_code == ExitCode.PASSED
-    assert ref in res.output
-
-    ref = """OUTPUT: hello world"""
-    res = cli.invoke(build_magic, ['--verbose', 'echo hello world'])
-    assert res.exit_code == ExitCode.PASSED
-    assert ref in res.output
-
-    ref = """OUTPUT: hello world"""
-    res = cli.invoke(build_magic, ['--verbose', '--fancy', 'echo hello world'])
+    res = cli.invoke(build_magic_cmd, [*options, 'echo hello world'])
     assert res.exit_code == ExitCode.PASSED
     assert ref in res.output
 
 
-def test_cli_quiet(cli):
+@pytest.mark.shell
+def test_cli_quiet(build_magic_cmd, cli):
     """Verify the --quiet option supresses output correctly."""
-    res = cli.invoke(build_magic, ['--quiet', '--verbose', 'echo hello world'])
+    res = cli.invoke(build_magic_cmd, ['--quiet', '--verbose', 'echo hello world'])
     assert res.exit_code == ExitCode.PASSED
     assert not res.output
 
-    res = cli.invoke(build_magic, ['--quiet', 'cp'])
+    res = cli.invoke(build_magic_cmd, ['--quiet', 'cp'])
     assert res.exit_code == ExitCode.FAILED
     assert not res.output
 
 
-def test_cli_fancy(cli):
+@pytest.mark.usefixtures('fast_local')
+def test_cli_fancy(build_magic_cmd, cli):
     """Verify the --fancy option works correctly."""
     ref = """( 1/1 ) EXECUTE : echo hello world ."""
-    res = cli.invoke(build_magic, ['--fancy', 'echo hello world'])
+    res = cli.invoke(build_magic_cmd, ['--fancy', 'echo hello world'])
     assert res.exit_code == ExitCode.PASSED
     assert ref in res.output
 
-    res = cli.invoke(build_magic, ['echo hello world'])
+    res = cli.invoke(build_magic_cmd, ['echo hello world'])
     assert res.exit_code == ExitCode.PASSED
     assert ref in res.output
 
 
-def test_cli_plain_and_fancy(cli):
+@pytest.mark.usefixtures('fast_local')
+@pytest.mark.parametrize('args', PLAIN_FANCY_ARGS)
+def test_cli_plain_and_fancy(args, build_magic_cmd, cli):
     """Test the case where both --plain and --fancy options are provided."""
     ref = """[ DONE  ] ( 1/1 ) EXECUTE  : echo hello world"""
-    res = cli.invoke(build_magic, ['--plain', '--fancy', 'echo hello world'])
-    assert res.exit_code == ExitCode.PASSED
-    assert ref in res.output
-
-    res = cli.invoke(build_magic, ['--fancy', '--plain', 'echo hello world'])
+    res = cli.invoke(build_magic_cmd, args)
     assert res.exit_code == ExitCode.PASSED
     assert ref in res.output
 
 
-def test_cli_plain_quiet(cli):
+@pytest.mark.usefixtures('fast_local')
+@pytest.mark.parametrize('args', PLAIN_QUIET_ARGS)
+def test_cli_plain_quiet(args, build_magic_cmd, cli):
     """Test the case where both --plain and --quiet options are provided."""
-    res = cli.invoke(build_magic, ['--plain', '--quiet', 'echo hello world'])
-    assert res.exit_code == ExitCode.PASSED
-    assert not res.output
-
-    res = cli.invoke(build_magic, ['--quiet', '--plain', 'echo hello world'])
+    res = cli.invoke(build_magic_cmd, args)
     assert res.exit_code == ExitCode.PASSED
     assert not res.output
 
 
-def test_cli_fancy_quiet(cli):
+@pytest.mark.usefixtures('fast_local')
+@pytest.mark.parametrize('args', FANCY_QUIET_ARGS)
+def test_cli_fancy_quiet(args, build_magic_cmd, cli):
     """Test the case where both --fancy and --quiet options are provided."""
-    res = cli.invoke(build_magic, ['--fancy', '--quiet', 'echo hello world'])
-    assert res.exit_code == ExitCode.PASSED
-    assert not res.output
-
-    res = cli.invoke(build_magic, ['--quiet', '--fancy', 'echo hello world'])
+    res = cli.invoke(build_magic_cmd, args)
     assert res.exit_code == ExitCode.PASSED
     assert not res.output
 
 
-def test_cli_fancy_plain_quiet(cli):
+@pytest.mark.usefixtures('fast_local')
+@pytest.mark.parametrize('args', FANCY_PLAIN_QUIET_ARGS)
+def test_cli_fancy_plain_quiet(args, build_magic_cmd, cli):
     """Test the case where --fancy, --plain, and --quiet are provided."""
-    res = cli.invoke(build_magic, ['--fancy', '--plain', '--quiet', 'echo hello world'])
-    assert res.exit_code == ExitCode.PASSED
-    assert not res.output
-
-    res = cli.invoke(build_magic, ['--plain', '--quiet', '--fancy', 'echo hello world'])
-    assert res.exit_code == ExitCode.PASSED
-    assert not res.output
-
-    res = cli.invoke(build_magic, ['--quiet', '--fancy', '--plain', 'echo hello world'])
+    res = cli.invoke(build_magic_cmd, args)
     assert res.exit_code == ExitCode.PASSED
     assert not res.output
 
-    res = cli.invoke(build_magic, ['--fancy', '--quiet', '--plain', 'echo hello world'])
-    assert res.exit_code == ExitCode.PASSED
-    assert not res.output
 
-    res = cli.invoke(build_magic, ['--quiet', '--plain', '--fancy', 'echo hello world'])
-    assert res.exit_code == ExitCode.PASSED
-    assert not res.output
-
-    res = cli.invoke(build_magic, ['--plain', '--fancy', '--quiet', 'echo hello world'])
-    assert res.exit_code == ExitCode.PASSED
-    assert not res.output
-
-
-def test_cli_version(cli):
+def test_cli_version(build_magic_cmd, cli):
     """Verify the --version option works correctly."""
-    res = cli.invoke(build_magic, ['--version'])
+    res = cli.invoke(build_magic_cmd, ['--version'])
     assert res.exit_code == ExitCode.PASSED
     assert res.output == f'{version}\n'
 
 
-def test_keyboard_interrupt(cli, mocker):
+def test_keyboard_interrupt(build_magic_cmd, cli, mocker):
     """Test the case where build-magic is interrupted with SIGINT."""
     mocker.patch('build_magic.core.Engine.run', side_effect=KeyboardInterrupt)
     ref = """
 build-magic interrupted and exiting....
 """
-    res = cli.invoke(build_magic, ['sleep 5'])
+    res = cli.invoke(build_magic_cmd, ['sleep 5'])
     assert res.exit_code == ExitCode.INTERRUPTED
     assert res.output == ref
 
 
-def test_cli_copy(cat, cli, tmp_file):
+@pytest.mark.shell
+def test_cli_copy(build_magic_cmd, cat, cli, magic_dir, monkeypatch, tmp_file_str):
     """Verify the --copy option works correctly."""
+    monkeypatch.chdir(magic_dir)
     res = cli.invoke(
-        build_magic,
-        ['--copy', str(tmp_file), '--verbose', '-c', 'execute', f'{cat} hello.txt', 'hello.txt'],
+        build_magic_cmd,
+        ['--copy', tmp_file_str, '--verbose', '-c', 'execute', f'{cat} hello.txt', 'hello.txt'],
     )
     assert 'OUTPUT: hello world' in res.output
     assert res.exit_code == ExitCode.PASSED
 
 
-def test_cli_working_directory(cat, cli, tmp_file):
+@pytest.mark.usefixtures('restore_cwd')
+@pytest.mark.shell
+def test_cli_working_directory(build_magic_cmd, cat, cli, tmp_file_str):
     """Verify the --wd option works correctly."""
-    res = cli.invoke(build_magic, ['--wd', str(tmp_file), '--verbose', '-c', 'execute', f'{cat} hello.txt'])
+    res = cli.invoke(build_magic_cmd, ['--wd', tmp_file_str, '--verbose', '-c', 'execute', f'{cat} hello.txt'])
     assert res.exit_code == ExitCode.PASSED
     assert 'OUTPUT: hello world' in res.output
 
 
-def test_cli_copy_working_directory(cat, cli, current_file):
+@pytest.mark.usefixtures('restore_cwd')
+@pytest.mark.shell
+def test_cli_copy_working_directory(build_magic_cmd, cat, cli, current_file, magic_dir_fn):
     """Verify the --copy and --wd options work together correctly."""
+    copy = str(current_file.parent)
     res = cli.invoke(
-        build_magic,
-        ['--copy', '.', '--wd', str(current_file), '--verbose', '-c', 'build', f'{cat} hello.txt', 'hello.txt'],
+        build_magic_cmd,
+        ['--copy', copy, '--wd', str(magic_dir_fn), '--verbose', '-c', 'build', f'{cat} hello.txt', 'hello.txt'],
     )
+    assert magic_dir_fn.joinpath('hello.txt').exists()
     assert 'OUTPUT: hello world' in res.output
     assert res.exit_code == ExitCode.PASSED
 
 
-def test_cli_continue_on_fail(cli):
+@pytest.mark.shell
+def test_cli_continue_on_fail(build_magic_cmd, cli):
     """Verify the --continue option works correctly."""
-    res = cli.invoke(build_magic, ['--verbose', '--continue', '-c', 'execute', 'cp', '-c', 'execute', 'echo hello'])
+    res = cli.invoke(build_magic_cmd, ['--verbose', '--continue', '-c', 'execute', 'cp', '-c', 'execute', 'echo hello'])
     assert 'OUTPUT: hello' in res.output
     assert res.exit_code == ExitCode.FAILED
 
 
-def test_cli_stop_on_fail(cli, cp):
+@pytest.mark.shell
+def test_cli_stop_on_fail(build_magic_cmd, cli, cp):
     """Verify the --stop option works correctly."""
-    res = cli.invoke(build_magic, ['--verbose', '--stop', '-c', 'execute', f'{cp}', '-c', 'execute', 'echo hello'])
-    if sys.platform == 'linux':
-        assert 'cp: missing file operand' in res.output
-    elif sys.platform == 'win32':
-        assert 'The syntax of the command is incorrect.' in res.output
-    else:
-        assert 'usage: cp' in res.output or 'cp: missing file operand' in res.output
+    res = cli.invoke(build_magic_cmd, ['--verbose', '--stop', '-c', 'execute', f'{cp}', '-c', 'execute', 'echo hello'])
+    assert any(error in res.output for error in CP_ERRORS)
     assert 'OUTPUT: hello' not in res.output
     assert res.exit_code == ExitCode.FAILED
 
 
-def test_cli_parameters(cli):
+@pytest.mark.usefixtures('fast_local')
+def test_cli_parameters(build_magic_cmd, cli):
     """Verify the --parameter option works correctly."""
-    res = cli.invoke(build_magic, ['-p', 'keytype', 'rsa', '--parameter', 'keypass', '1234', 'echo hello'])
+    res = cli.invoke(build_magic_cmd, ['-p', 'keytype', 'rsa', '--parameter', 'keypass', '1234', 'echo hello'])
     assert res.exit_code == ExitCode.PASSED
     assert '( 1/1 ) EXECUTE : echo hello ........................................ RUNNING' in res.output
     assert 'Stage 1 finished with result DONE' in res.output
 
 
-def test_cli_parameters_invalid_parameter(cli):
+def test_cli_parameters_invalid_parameter(invoke_fast):
     """Test the case where an invalid parameter is provided."""
-    res = cli.invoke(build_magic, ['-p', 'dummy', '1234', 'echo hello'])
-    assert res.exit_code == ExitCode.INPUT_ERROR
-    assert res.output == 'Parameter dummy is not a valid parameter.\n'
+    code, out = invoke_fast(['-p', 'dummy', '1234', 'echo hello'])
+    assert code == ExitCode.INPUT_ERROR
+    assert out == INVALID_PARAMETER
 
 
-def test_cli_parameters_invalid_parameter_value(cli):
+def test_cli_parameters_invalid_parameter_value(invoke_fast):
     """Test the case where an invalid parameter value is provided."""
-    res = cli.invoke(build_magic, ['-p', 'keytype', 'dummy', 'echo hello'])
-    assert res.exit_code == ExitCode.INPUT_ERROR
-    assert "Validation failed: Value dummy is not one of " in res.output
+    code, out = invoke_fast(['-p', 'keytype', 'dummy', 'echo hello'])
+    assert code == ExitCode.INPUT_ERROR
+    assert INVALID_PARAMETER_VALUE in out
 
 
-def test_cli_config_template(cli):
+def test_cli_config_template(build_magic_cmd, cli, monkeypatch, tmp_path):
     """Verify the --template option works correctly."""
-    filename = 'build-magic_template.yaml'
-    current = Path().cwd().resolve()
-    res = cli.invoke(build_magic, ['--template'])
-    assert current.joinpath(filename).exists()
-    os.remove(filename)
+    monkeypatch.chdir(tmp_path)
+    res = cli.invoke(build_magic_cmd, ['--template'])
+    assert tmp_path.joinpath('build-magic_template.yaml').exists()
     assert res.exit_code == ExitCode.PASSED
 
 
-def test_cli_template_exists(cli):
+def test_cli_template_exists(build_magic_cmd, cli, monkeypatch, tmp_path):
     """Test the case where a template config file cannot be generated because one already exists."""
-    filename = 'build-magic_template.yaml'
-    current = Path.cwd().resolve()
-    Path.touch(current.joinpath(filename))
-    res = cli.invoke(build_magic, ['--template'])
-    os.remove(filename)
+    monkeypatch.chdir(tmp_path)
+    tmp_path.joinpath('build-magic_template.yaml').touch()
+    res = cli.invoke(build_magic_cmd, ['--template'])
     assert res.exit_code == ExitCode.INPUT_ERROR
     assert res.output == 'Cannot generate the config template because it already exists!\n'
 
 
-def test_cli_template_permission_error(cli, mocker):
+def test_cli_template_permission_error(build_magic_cmd, cli, mocker):
     """Test the case where a template config file cannot be generated because the user does not have permission."""
     mocker.patch('build_magic.core.generate_config_template', side_effect=PermissionError)
-    res = cli.invoke(build_magic, ['--template'])
+    res = cli.invoke(build_magic_cmd, ['--template'])
     assert res.exit_code == ExitCode.INPUT_ERROR
     assert res.output == "Cannot generate the config template because build-magic doesn't have permission.\n"
 
 
-def test_cli_config(cli, config_file, ls):
+@pytest.mark.shell
+def test_cli_config(build_magic_cmd, cli, config_file, ls):
     """Verify the --config option works correctly."""
-    res = cli.invoke(build_magic, ['--config', str(config_file)])
+    res = cli.invoke(build_magic_cmd, ['--config', str(config_file)])
     assert res.exit_code == ExitCode.PASSED
     assert 'Starting Stage 1: Test stage' in res.output
     assert '( 1/2 ) EXECUTE : echo hello' in res.output
@@ -730,43 +689,31 @@ def test_cli_config(cli, config_file, ls):
     assert 'build-magic finished in' in res.output
 
 
-def test_cli_config_multi(cli, config_file, multi_config):
+@pytest.mark.shell
+def test_cli_config_multi(build_magic_cmd, cli, config_file, monkeypatch, multi_config, tmp_path):
     """Verify assigning multiple config files works correctly."""
+    monkeypatch.chdir(tmp_path)
     file1 = config_file
     file2 = multi_config
-    res = cli.invoke(build_magic, ['--config', str(file1), '--config', str(file2)])
+    res = cli.invoke(build_magic_cmd, ['--config', str(file1), '--config', str(file2)])
     assert res.exit_code == ExitCode.PASSED
-    assert 'Starting Stage 1: Test stage' in res.output
-    assert 'Starting Stage 2: Stage A' in res.output
-    assert 'Starting Stage 3: Stage B' in res.output
-    assert 'Stage 1: Test stage - finished with result DONE' in res.output
-    assert 'Stage 2: Stage A - finished with result DONE' in res.output
-    assert 'Stage 3: Stage B - finished with result DONE' in res.output
+    assert set(CONFIG_MULTI_PATTERN.findall(res.output)) == set(CONFIG_MULTI_MARKERS)
 
 
-def test_cli_config_parameters(cli, mocker, parameters_config):
+def test_cli_config_parameters(build_magic_cmd, cli, mocked_ssh, parameters_config):
     """Verify assigning parameters from a config file works correctly."""
-    mocker.patch('paramiko.ECDSAKey.from_private_key_file')
-    mocker.patch('build_magic.runner.Remote.connect', return_value=paramiko.SSHClient)
-    mocker.patch(
-        'paramiko.SSHClient.exec_command',
-        return_value=(
-            None,
-            MagicMock(readlines=lambda: 'hello', channel=MagicMock(recv_exit_status=lambda: 0)),
-            MagicMock(readlines=lambda: '')
-        )
-    )
-    mocker.patch('paramiko.SSHClient.close')
-    res = cli.invoke(build_magic, ['--config', str(parameters_config)])
+    res = cli.invoke(build_magic_cmd, ['--config', str(parameters_config)])
     assert res.exit_code == ExitCode.PASSED
+    assert mocked_ssh.call_count == 1
     assert "Starting Stage 1" in res.output
     assert "( 1/1 ) EXECUTE : echo hello ........................................ RUNNING" in res.output
     assert "Stage 1 finished with result DONE" in res.output
 
 
-def test_cli_target(cli, targets_config):
+@pytest.mark.shell
+def test_cli_target(build_magic_cmd, cli, targets_config):
     """Verify the --target option works correctly."""
-    res = cli.invoke(build_magic, ['-C', str(targets_config), '--target', 'Stage D', '-t', 'Stage B'])
+    res = cli.invoke(build_magic_cmd, ['-C', str(targets_config), '--target', 'Stage D', '-t', 'Stage B'])
     assert res.exit_code == ExitCode.PASSED
     out = res.output
     assert 'Stage D - Test Stage D' in out
@@ -776,27 +723,27 @@ def test_cli_target(cli, targets_config):
     assert "Stage 2: Stage B - finished with result DONE" in res.output
 
 
-def test_cli_invalid_target(cli, targets_config):
+def test_cli_invalid_target(invoke_fast, targets_config):
     """Test the case where an invalid target name is provided."""
-    res = cli.invoke(build_magic, ['-C', str(targets_config), '-t', 'blarg'])
-    out = res.output
-    assert res.exit_code == ExitCode.INPUT_ERROR
+    code, out = invoke_fast(['-C', str(targets_config), '-t', 'blarg'])
+    assert code == ExitCode.INPUT_ERROR
     assert out == "Target blarg not found among ['Stage A', 'Stage B', 'Stage C', 'Stage D'].\n"
 
 
-def test_cli_yaml_parsing_error(cli, config_file, mocker):
+def test_cli_yaml_parsing_error(build_magic_cmd, cli, config_file, mocker):
     """Test the case where there's an error when parsing a config file."""
     yaml_load = mocker.patch('yaml.safe_load', side_effect=ComposerError('YAML error'))
-    res = cli.invoke(build_magic, ['-C', str(config_file)])
+    res = cli.invoke(build_magic_cmd, ['-C', str(config_file)])
     out = res.output
     assert res.exit_code == ExitCode.INPUT_ERROR
     assert out == 'YAML error\n'
     assert yaml_load.call_count == 1
 
 
-def test_cli_default_config_all_stages(cli, default_config):
+@pytest.mark.shell
+def test_cli_default_config_all_stages(build_magic_cmd, cli, default_config):
     """Verify the "all" argument works with a default config file."""
-    res = cli.invoke(build_magic, ['all'])
+    res = cli.invoke(build_magic_cmd, ['all'])
     out = res.output
     assert res.exit_code == ExitCode.PASSED
     assert 'Starting Stage 1: build' in out
@@ -804,9 +751,10 @@ def test_cli_default_config_all_stages(cli, default_config):
     assert 'Starting Stage 3: release' in out
 
 
-def test_cli_default_config_single_stage(cli, default_config):
+@pytest.mark.shell
+def test_cli_default_config_single_stage(build_magic_cmd, cli, default_config):
     """Verify running a single stage by name as an argument works with a default config file."""
-    res = cli.invoke(build_magic, ['deploy'])
+    res = cli.invoke(build_magic_cmd, ['deploy'])
     out = res.output
     assert res.exit_code == ExitCode.PASSED
     assert ('Starting Stage 1: build' in out) is False
@@ -814,9 +762,10 @@ def test_cli_default_config_single_stage(cli, default_config):
     assert ('Starting Stage 3: release' in out) is False
 
 
-def test_cli_default_config_reorder_stages(cli, default_config):
+@pytest.mark.shell
+def test_cli_default_config_reorder_stages(build_magic_cmd, cli, default_config):
     """Verify running stages in a custom order by arguments works with a default config file."""
-    res = cli.invoke(build_magic, ['release', 'deploy', 'build'])
+    res = cli.invoke(build_magic_cmd, ['release', 'deploy', 'build'])
     out = res.output
     assert res.exit_code == ExitCode.PASSED
     assert 'Starting Stage 3: build' in out
@@ -824,18 +773,20 @@ def test_cli_default_config_reorder_stages(cli, default_config):
     assert 'Starting Stage 1: release' in out
 
 
-def test_cli_default_config_repeat_stages(cli, default_config):
+@pytest.mark.shell
+def test_cli_default_config_repeat_stages(build_magic_cmd, cli, default_config):
     """Verify running stages more than once by arguments works with a default config file."""
-    res = cli.invoke(build_magic, ['release', 'release'])
+    res = cli.invoke(build_magic_cmd, ['release', 'release'])
     out = res.output
     assert res.exit_code == ExitCode.PASSED
     assert 'Starting Stage 1: release' in out
     assert 'Starting Stage 2: release' in out
 
 
-def test_cli_default_config_with_targets(cli, default_config):
+@pytest.mark.shell
+def test_cli_default_config_with_targets(build_magic_cmd, cli, default_config):
     """Verify running stages using the --target option works with a default config file."""
-    res = cli.invoke(build_magic, ['-t', 'release', '-t', 'deploy', '-t', 'build'])
+    res = cli.invoke(build_magic_cmd, ['-t', 'release', '-t', 'deploy', '-t', 'build'])
     out = res.output
     assert res.exit_code == ExitCode.PASSED
     assert 'Starting Stage 3: build' in out
@@ -843,9 +794,10 @@ def test_cli_default_config_with_targets(cli, default_config):
     assert 'Starting Stage 1: release' in out
 
 
-def test_cli_default_config_repeat_stages_all(cli, default_config):
+@pytest.mark.shell
+def test_cli_default_config_repeat_stages_all(build_magic_cmd, cli, default_config):
     """Verify running stages more than once by using all works with a default config file."""
-    res = cli.invoke(build_magic, ['all', 'build'])
+    res = cli.invoke(build_magic_cmd, ['all', 'build'])
     out = res.output
     assert res.exit_code == ExitCode.PASSED
     assert 'Starting Stage 1: build' in out
@@ -854,21 +806,23 @@ def test_cli_default_config_repeat_stages_all(cli, default_config):
     assert 'Starting Stage 4: build' in out
 
 
-def test_cli_default_config_with_ad_hoc_command(cli, default_config):
+@pytest.mark.shell
+def test_cli_default_config_with_ad_hoc_command(build_magic_cmd, cli, default_config):
     """Verify running an ad hoc command works correctly with a default config file."""
-    res = cli.invoke(build_magic, ['--name', 'test', 'echo "hello world"'])
+    res = cli.invoke(build_magic_cmd, ['--name', 'test', 'echo "hello world"'])
     out = res.output
     assert res.exit_code == ExitCode.PASSED
     assert ('Starting Stage 1: test' in out) is True
     assert ('echo "hello world"' in out) is True
 
 
-def test_cli_default_config_with_ad_hoc_command_no_quotes(cli, default_config):
+@pytest.mark.shell
+def test_cli_default_config_with_ad_hoc_command_no_quotes(build_magic_cmd, cli, default_config):
     """Verify running an un-quoted ad hoc command works correctly with a default config file.
 
     This test covers an edge case where a default config exists, but an un-quoted ad hoc command is provided,
     causing the command to be executed n times where n is the number of args in the command."""
-    res = cli.invoke(build_magic, ['echo', 'hello', 'world'])
+    res = cli.invoke(build_magic_cmd, ['echo', 'hello', 'world'])
     out = res.output
     assert res.exit_code == ExitCode.PASSED
     assert ('Starting Stage 1' in out) is True
@@ -877,68 +831,78 @@ def test_cli_default_config_with_ad_hoc_command_no_quotes(cli, default_config):
     assert ('Starting Stage 3' in out) is False
 
 
-def test_cli_default_config_not_repeated(cli, default_config):
+@pytest.mark.shell
+def test_cli_default_config_not_repeated(build_magic_cmd, cli, default_config):
     """Test the case where a default config file is added explicitly with --command option."""
-    res = cli.invoke(build_magic, ['-C', 'build-magic.yaml', '-t', 'deploy'])
+    res = cli.invoke(build_magic_cmd, ['-C', 'build-magic.yaml', '-t', 'deploy'])
     out = res.output
     assert res.exit_code == ExitCode.PASSED
     assert ('Starting Stage 1: deploy' in out) is True
     assert ('Starting Stage 2: deploy' in out) is False
 
 
-def test_cli_default_config_usage(cli, default_config):
+def test_cli_default_config_usage(build_magic_cmd, cli, default_config):
     """Verify the usage is printed when a default config file is present."""
-    res = cli.invoke(build_magic)
+    res = cli.invoke(build_magic_cmd)
     assert res.exit_code == ExitCode.NO_TESTS
-    assert res.output == USAGE
+    assert res.output.startswith(USAGE_LINE)
+    for line in NO_OPTIONS_REF:
+        assert line in res.output
 
 
-def test_cli_default_config_multiple_commands(cli, default_config):
+@pytest.mark.shell
+def test_cli_default_config_multiple_commands(build_magic_cmd, cli, default_config):
     """Verify running multiple commands works when a default config file is present."""
-    res = cli.invoke(build_magic, ['-c', 'execute', 'echo hello', '-c', 'execute', 'echo world'])
+    res = cli.invoke(build_magic_cmd, ['-c', 'execute', 'echo hello', '-c', 'execute', 'echo world'])
     out = res.output
     assert res.exit_code == ExitCode.PASSED
     assert "EXECUTE : echo hello" in out
     assert "EXECUTE : echo world" in out
 
 
-def test_cli_default_config_multiple_defaults_error(cli, default_config, second_default):
+def test_cli_default_config_multiple_defaults_error(build_magic_cmd, cli, default_config, second_default):
     """Test the case where an error is raised if there's more than one default config file."""
-    res = cli.invoke(build_magic, ['all'])
+    res = cli.invoke(build_magic_cmd, ['all'])
     out = res.output
     assert res.exit_code == ExitCode.INPUT_ERROR
     assert 'More than one config file found:' in out
 
 
-def test_cli_variable(cli, variables_config):
+@pytest.mark.shell
+def test_cli_variable(build_magic_cmd, cli, variables_config):
     """Verify adding variables from the CLI properly replaces placeholders in a config file."""
-    res = cli.invoke(build_magic, ['-C', variables_config, '--variable', 'ARCH', 'arm64', '-v', 'OS', 'linux'])
+    res = cli.invoke(build_magic_cmd, ['-C', variables_config, '--variable', 'ARCH', 'arm64', '-v', 'OS', 'linux'])
     out = res.output
     assert res.exit_code == ExitCode.PASSED
     assert "EXECUTE : echo GOARCH=arm64" in out
     assert "EXECUTE : echo GOOS=linux" in out
 
 
-def test_cli_variable_not_found(cli, variables_config):
+def test_cli_variable_not_found(invoke_fast, variables_config):
     """Test the case where variables aren't substituted because they aren't found in the config file."""
-    res = cli.invoke(build_magic, ['-C', variables_config, '--variable', 'user', 'elle', '-v', 'host', 'server'])
-    out = res.output
-    assert res.exit_code == ExitCode.INPUT_ERROR
+    code, out = invoke_fast(['-C', variables_config, '--variable', 'user', 'elle', '-v', 'host', 'server'])
+    assert code == ExitCode.INPUT_ERROR
     assert out == 'No variable matches found.\n'
 
 
-def test_cli_prompt(cli, prompt_config):
+@pytest.mark.shell
+def test_cli_prompt(build_magic_cmd, cli, prompt_config):
     """Verify the prompt option works correctly."""
-    res = cli.invoke(build_magic, ['-C', prompt_config, '-v', 'user', 'elle', '--prompt', 'password'], input='secret\n')
+    res = cli.invoke(
+        build_magic_cmd,
+        ['-C', prompt_config, '-v', 'user', 'elle', '--prompt', 'password'],
+        input='secret\n',
+    )
     out = res.output
     assert res.exit_code == ExitCode.PASSED
     assert 'EXECUTE : echo elle:******' in out
 
 
-def test_cli_variables_with_two_config_files(cli, variable_and_default_config):
+@pytest.mark.shell
+def test_cli_variables_with_two_config_files(build_magic_cmd, cli, variable_and_default_config):
     """Verify using variables still works when there is one config file with placeholders and one without."""
     # Without the default config
-    res = cli.invoke(build_magic, ['-C', 'variables.yaml', '--variable', 'ARCH', 'arm64', '-v', 'OS', 'linux'])
+    res = cli.invoke(build_magic_cmd, ['-C', 'variables.yaml', '--variable', 'ARCH', 'arm64', '-v', 'OS', 'linux'])
     out = res.output
     assert res.exit_code == ExitCode.PASSED
     assert "EXECUTE : echo GOARCH=arm64" in out
@@ -946,7 +910,7 @@ def test_cli_variables_with_two_config_files(cli, variable_and_default_config):
 
     # Including the default config
     res = cli.invoke(
-        build_magic,
+        build_magic_cmd,
         ['-C', 'variables.yaml', '-C', 'build-magic.yaml', '--variable', 'ARCH', 'arm64', '-v', 'OS', 'linux'],
     )
     out = res.output
@@ -955,11 +919,12 @@ def test_cli_variables_with_two_config_files(cli, variable_and_default_config):
     assert "EXECUTE : echo GOOS=linux" in out
 
 
-def test_cli_prompt_with_two_config_files(cli, prompt_and_default_config):
+@pytest.mark.shell
+def test_cli_prompt_with_two_config_files(build_magic_cmd, cli, prompt_and_default_config):
     """Verify using prompt still works when there is one config file with placeholders and one without."""
     # Without the default config
     res = cli.invoke(
-        build_magic,
+        build_magic_cmd,
         ['-C', 'prompt.yaml', '-v', 'user', 'elle', '--prompt', 'password'],
         input='secret\n',
     )
@@ -969,7 +934,7 @@ def test_cli_prompt_with_two_config_files(cli, prompt_and_default_config):
 
     # Including the default config
     res = cli.invoke(
-        build_magic,
+        build_magic_cmd,
         ['-C', 'prompt.yaml', '-C', 'build-magic.yaml', '-v', 'user', 'elle', '--prompt', 'password'],
         input='secret\n',
     )
@@ -978,9 +943,10 @@ def test_cli_prompt_with_two_config_files(cli, prompt_and_default_config):
     assert 'EXECUTE : echo elle:******' in out
 
 
-def test_cli_config_with_prepare(cli, prepare_config):
+@pytest.mark.shell
+def test_cli_config_with_prepare(build_magic_cmd, cli, prepare_config):
     """Verify a config file with a prepare section works correctly."""
-    res = cli.invoke(build_magic, ['-C', prepare_config])
+    res = cli.invoke(build_magic_cmd, ['-C', prepare_config])
     out = res.output
     assert res.exit_code == ExitCode.PASSED
     assert '( 1/3 ) EXECUTE : echo hello' in out
@@ -990,24 +956,24 @@ def test_cli_config_with_prepare(cli, prepare_config):
     assert '( 2/2 ) EXECUTE : echo spam' in out
 
 
-def test_cli_config_with_metadata(cli, meta_config):
+@pytest.mark.shell
+def test_cli_config_with_metadata(build_magic_cmd, cli, meta_config):
     """Verify a config file with metadata works correctly."""
-    res = cli.invoke(build_magic, ['-C', meta_config])
+    res = cli.invoke(build_magic_cmd, ['-C', meta_config])
     out = res.output
     assert res.exit_code == ExitCode.PASSED
     assert '( 1/1 ) EXECUTE : echo "hello world"' in out
 
 
-def test_cli_info_no_config(cli):
+def test_cli_info_no_config(invoke_fast):
     """Test the case where the --info option is used with a config file."""
     ref = """No config files specified.\n"""
-    res = cli.invoke(build_magic, ['--info'])
-    out = res.output
-    assert res.exit_code == ExitCode.INPUT_ERROR
+    code, out = invoke_fast(['--info'])
+    assert code == ExitCode.INPUT_ERROR
     assert out == ref
 
 
-def test_cli_info(cli, meta_config):
+def test_cli_info(build_magic_cmd, cli, meta_config):
     """Verify the --info option works correctly with one config file."""
     ref = """version:      0.1.0
 author:       Beckett Mariner
@@ -1017,16 +983,16 @@ modified:     06/02/2382
 description:  Second contact
 stage:        Test
 """
-    res = cli.invoke(build_magic, ['--info', str(meta_config)])
+    res = cli.invoke(build_magic_cmd, ['--info', str(meta_config)])
     out = res.output
     assert res.exit_code == ExitCode.PASSED
     assert out == ref
 
 
-def test_cli_info_two_configs(cli):
+def test_cli_info_two_configs(build_magic_cmd, cli):
     """Verify the --info option works correctly with more than one config file."""
-    meta = str(Path(__file__).parent / 'files' / 'meta.yaml')
-    variables = str(Path(__file__).parent / 'files' / 'variables.yaml')
+    meta = str(FILES / 'meta.yaml')
+    variables = str(FILES / 'variables.yaml')
     ref = f"""{meta}  version:      0.1.0
 {meta}  author:       Beckett Mariner
 {meta}  maintainer:   Brad Boimler
@@ -1038,26 +1004,26 @@ def test_cli_info_two_configs(cli):
 {variables}  variable:  OS
 {variables}  stage:     Variable Test
 """
-    res = cli.invoke(build_magic, ['--info', meta, variables])
+    res = cli.invoke(build_magic_cmd, ['--info', meta, variables])
     out = res.output
     assert res.exit_code == ExitCode.PASSED
     assert out == ref
 
 
-def test_cli_info_no_meta_data(cli):
+def test_cli_info_no_meta_data(build_magic_cmd, cli):
     """Test the case where --info is called on a Config File without meta data or a stage name."""
-    skip1 = str(Path(__file__).parent / 'files' / 'skip1.yaml')
-    res = cli.invoke(build_magic, ['--info', skip1])
+    skip1 = str(FILES / 'skip1.yaml')
+    res = cli.invoke(build_magic_cmd, ['--info', skip1])
     out = res.output
     assert res.exit_code == ExitCode.PASSED
     assert out == ''
 
 
-def test_cli_info_two_configs_no_meta_data(cli):
+def test_cli_info_two_configs_no_meta_data(build_magic_cmd, cli):
     """Test the case where --info is called on two Config Files where one doesn't have meta data or a stage name."""
-    meta = str(Path(__file__).parent / 'files' / 'meta.yaml')
-    skip1 = str(Path(__file__).parent / 'files' / 'skip1.yaml')
-    res = cli.invoke(build_magic, ['--info', skip1, meta])
+    meta = str(FILES / 'meta.yaml')
+    skip1 = str(FILES / 'skip1.yaml')
+    res = cli.invoke(build_magic_cmd, ['--info', skip1, meta])
     out = res.output
     assert res.exit_code == ExitCode.PASSED
     assert 'meta.yaml  author:       Beckett Mariner' in out
@@ -1068,21 +1034,22 @@ def test_cli_info_two_configs_no_meta_data(cli):
     assert 'meta.yaml  stage:        Test' in out
 
 
-def test_cli_info_extra_options_and_args(cli):
+def test_cli_info_extra_options_and_args(build_magic_cmd, cli):
     """Test the case where extra args are given to the --info option."""
-    meta = str(Path(__file__).parent / 'files' / 'meta.yaml')
-    targets = str(Path(__file__).parent / 'files' / 'targets.yaml')
+    meta = str(FILES / 'meta.yaml')
+    targets = str(FILES / 'targets.yaml')
     ref = "[Errno 2] No such file or directory: 'echo hello world'\n"
-    res = cli.invoke(build_magic, ['--info', meta, targets, '--verbose', 'echo hello world'])
+    res = cli.invoke(build_magic_cmd, ['--info', meta, targets, '--verbose', 'echo hello world'])
     out = res.output
     assert res.exit_code == ExitCode.INPUT_ERROR
     assert out == ref
 
 
-def test_cli_dotenv(cli, env):
+@pytest.mark.shell
+def test_cli_dotenv(build_magic_cmd, cli, env):
     """Verify the --dotenv option works correctly."""
-    env_file = Path(__file__).parent / 'files' / 'test.env'
-    res = cli.invoke(build_magic, ['--dotenv', env_file, '--verbose', env])
+    env_file = FILES / 'test.env'
+    res = cli.invoke(build_magic_cmd, ['--dotenv', env_file, '--verbose', env])
     out = res.output
     assert res.exit_code == ExitCode.PASSED
     assert 'FOO=bar' in out
@@ -1090,23 +1057,24 @@ def test_cli_dotenv(cli, env):
     assert 'dummy' not in out
 
 
-def test_cli_dotenv_warn(cli):
+def test_cli_dotenv_warn(build_magic_cmd, cli):
     """Test the case where a dotenv file without a .env extension is provided."""
     cmd = 'env'
-    env_file = Path(__file__).parent / 'files' / 'meta.yaml'
-    res = cli.invoke(build_magic, ['--dotenv', env_file, '--verbose', cmd], input='N')
+    env_file = FILES / 'meta.yaml'
+    res = cli.invoke(build_magic_cmd, ['--dotenv', env_file, '--verbose', cmd], input='N')
     out = res.output
     assert res.exit_code == ExitCode.INPUT_ERROR
     assert 'The provided dotenv file does not have a .env extension. Continue anyway?' in out
 
 
-def test_cli_dotenv_config_file(cli, dotenv_config):
+@pytest.mark.shell
+def test_cli_dotenv_config_file(build_magic_cmd, cli, dotenv_config):
     """Verify the dotenv config file property works correctly."""
     if platform.system() == 'Windows':
         config = dotenv_config / 'dotenv_win.yaml'
     else:
         config = dotenv_config / 'dotenv.yaml'
-    res = cli.invoke(build_magic, ['-C', config, '--verbose'])
+    res = cli.invoke(build_magic_cmd, ['-C', config, '--verbose'])
     out = res.output
     assert res.exit_code == ExitCode.PASSED
     assert 'FOO=bar' in out
@@ -1114,14 +1082,15 @@ def test_cli_dotenv_config_file(cli, dotenv_config):
     assert 'dummy' not in out
 
 
-def test_cli_environment_variables(cli):
+@pytest.mark.shell
+def test_cli_environment_variables(build_magic_cmd, cli):
     """Verify setting environment variables works correctly."""
     if platform.system() == 'Windows':
         cmd = '%HELLO% %WORLD%'
     else:
         cmd = '$HELLO $WORLD'
     res = cli.invoke(
-        build_magic, [
+        build_magic_cmd, [
             '--env',
             'HELLO',
             'hello',
@@ -1138,15 +1107,16 @@ def test_cli_environment_variables(cli):
     assert 'OUTPUT: hello world' in out
 
 
-def test_combine_envs_and_dotenv(cli):
+@pytest.mark.shell
+def test_combine_envs_and_dotenv(build_magic_cmd, cli):
     """Verify that using a dotenv and individual environment variables are merged correctly."""
-    env_file = Path(__file__).parent / 'files' / 'test.env'
+    env_file = FILES / 'test.env'
     if platform.system() == 'Windows':
         cmd = '%HELLO% %WORLD% %FOO%'
     else:
         cmd = '$HELLO $WORLD $FOO'
     res = cli.invoke(
-        build_magic, [
+        build_magic_cmd, [
             '--env',
             'HELLO',
             'hello',
@@ -1165,38 +1135,40 @@ def test_combine_envs_and_dotenv(cli):
     assert 'OUTPUT: hello world bar' in out
 
 
-def test_envs_config_file(cli, env_and_dotenv_config):
+@pytest.mark.shell
+def test_envs_config_file(build_magic_cmd, cli, env_and_dotenv_config):
     """Verify that using environment variables with a dotenv file in a config file work correctly."""
     if platform.system() == 'Windows':
         config = env_and_dotenv_config / 'envs_win.yaml'
     else:
         config = env_and_dotenv_config / 'envs.yaml'
-    res = cli.invoke(build_magic, ['-C', config, '--verbose'])
+    res = cli.invoke(build_magic_cmd, ['-C', config, '--verbose'])
     out = res.output
     assert res.exit_code == ExitCode.PASSED
     assert 'OUTPUT: hello world bar' in out
 
 
-def test_labels_config_file(cli, labels_config):
+@pytest.mark.shell
+def test_labels_config_file(build_magic_cmd, cli, labels_config):
     """Verify that commands with labels in a config file are displayed properly."""
-    res = cli.invoke(build_magic, ['-C', labels_config, '--verbose'])
+    res = cli.invoke(build_magic_cmd, ['-C', labels_config, '--verbose'])
     out = res.output
     assert res.exit_code == ExitCode.PASSED
     assert '( 1/2 ) EXECUTE : Say hello to the user.' in out
     assert '( 2/2 ) EXECUTE : Say goodbye to the user.' in out
 
 
-def test_skip_single_stage(cli, mocker):
+def test_skip_single_stage(build_magic_cmd, cli, mocker):
     """Verify that skipping a single stage works correctly."""
     mocker.patch('subprocess.run', return_value=MagicMock(returncode=120, stdout=b'command not found\n'))
-    res = cli.invoke(build_magic, ['-r', 'local', '-e', 'windows', 'echo hello world'])
+    res = cli.invoke(build_magic_cmd, ['-r', 'local', '-e', 'windows', 'echo hello world'])
     out = res.output
     assert res.exit_code == ExitCode.SKIPPED
     assert 'Skipping Stage 1 because OS is not windows.' in out
-    assert 'Stage 1 finished with result SKIPPED' in out
+    assert STAGE1_SKIPPED in out
 
 
-def test_skip_one_stage_pass(cli, mocker, skip1_config):
+def test_skip_one_stage_pass(build_magic_cmd, cli, mocker, skip1_config):
     """Verify that skipping a single stage followed by a passing stage works correctly."""
     mocker.patch(
         'subprocess.run',
@@ -1211,14 +1183,14 @@ def test_skip_one_stage_pass(cli, mocker, skip1_config):
             )
         )
     )
-    res = cli.invoke(build_magic, ['-C', skip1_config])
+    res = cli.invoke(build_magic_cmd, ['-C', skip1_config])
     out = res.output
     assert res.exit_code == ExitCode.PASSED
-    assert 'Stage 1 finished with result SKIPPED' in out
+    assert STAGE1_SKIPPED in out
     assert 'Stage 2 finished with result DONE' in out
 
 
-def test_skip_one_stage_fail(cli, mocker, skip1fail_config):
+def test_skip_one_stage_fail(build_magic_cmd, cli, mocker, skip1fail_config):
     """Verify that skipping a single stage followed by a failing stage works correctly."""
     mocker.patch(
         'subprocess.run',
@@ -1233,16 +1205,17 @@ def test_skip_one_stage_fail(cli, mocker, skip1fail_config):
             )
         )
     )
-    res = cli.invoke(build_magic, ['-C', skip1fail_config])
+    res = cli.invoke(build_magic_cmd, ['-C', skip1fail_config])
     out = res.output
     assert res.exit_code == ExitCode.FAILED
-    assert 'Stage 1 finished with result SKIPPED' in out
+    assert STAGE1_SKIPPED in out
     assert 'Stage 2 finished with result FAILED' in out
 
 
-def test_manual_skip_one_stage(cli, targets_config):
+@pytest.mark.shell
+def test_manual_skip_one_stage(build_magic_cmd, cli, targets_config):
     """Verify manually skipping a single stage works correctly."""
-    res = cli.invoke(build_magic, ['-C', targets_config, '--skip', 'Stage C'])
+    res = cli.invoke(build_magic_cmd, ['-C', targets_config, '--skip', 'Stage C'])
     out = res.output
     assert res.exit_code == ExitCode.PASSED
     assert 'Stage 1: Stage A - finished with result DONE' in out
@@ -1252,9 +1225,10 @@ def test_manual_skip_one_stage(cli, targets_config):
     assert 'Stage 4: Stage D - finished with result DONE' in out
 
 
-def test_manual_skip_two_stage(cli, targets_config):
+@pytest.mark.shell
+def test_manual_skip_two_stage(build_magic_cmd, cli, targets_config):
     """Verify manually skipping multiple stages works correctly."""
-    res = cli.invoke(build_magic, ['-C', targets_config, '--skip', 'Stage A', '-s', 'Stage C'])
+    res = cli.invoke(build_magic_cmd, ['-C', targets_config, '--skip', 'Stage A', '-s', 'Stage C'])
     out = res.output
     assert res.exit_code == ExitCode.PASSED
     assert 'Skipping Stage 1: Stage A per user request.' in out
@@ -1265,24 +1239,24 @@ def test_manual_skip_two_stage(cli, targets_config):
     assert 'Stage 4: Stage D - finished with result DONE' in out
 
 
-def test_manual_skip_fail(cli, targets_config):
+def test_manual_skip_fail(invoke_fast, targets_config):
     """Test the case where a stage to skip is not in the stages to run."""
-    res = cli.invoke(build_magic, ['-C', targets_config, '--skip', 'Stage Z', '-s', 'Stage C'])
-    out = res.output
+    code, out = invoke_fast(['-C', targets_config, '--skip', 'Stage Z', '-s', 'Stage C'])
+    assert code == ExitCode.INPUT_ERROR
     assert "Cannot skip stage Stage Z because it was not found in ['Stage A', 'Stage B', 'Stage C', 'Stage D']." in out
 
 
-def test_manual_skip_fail_multiple_configs(cli, meta_config, targets_config):
+def test_manual_skip_fail_multiple_configs(invoke_fast, meta_config, targets_config):
     """Test the case where a stage to skip is not in the stages to run from multiple config files."""
-    res = cli.invoke(build_magic, ['-C', targets_config, '-C', meta_config, '--skip', 'Stage Z'])
-    out = res.output
+    code, out = invoke_fast(['-C', targets_config, '-C', meta_config, '--skip', 'Stage Z'])
+    assert code == ExitCode.INPUT_ERROR
     ref = "Cannot skip stage Stage Z because it was not found in ['Stage A', 'Stage B', 'Stage C', 'Stage D', 'Test']."
     assert ref in out
 
 
-def test_export_gitlab(cli, config_file):
+def test_export_gitlab(build_magic_cmd, cli, config_file):
     """Verify exporting a config file to gitlab works correctly."""
-    res = cli.invoke(build_magic, ['--export', config_file, 'gitlab'])
+    res = cli.invoke(build_magic_cmd, ['--export', config_file, 'gitlab'])
     out = res.output
     assert res.exit_code == ExitCode.PASSED
     assert out == """Test stage:
@@ -1294,9 +1268,9 @@ def test_export_gitlab(cli, config_file):
 """
 
 
-def test_export_github(cli, config_file):
+def test_export_github(build_magic_cmd, cli, config_file):
     """Verify exporting a config file to github works correctly."""
-    res = cli.invoke(build_magic, ['--export', config_file, 'github'])
+    res = cli.invoke(build_magic_cmd, ['--export', config_file, 'github'])
     out = res.output
     assert res.exit_code == ExitCode.PASSED
     assert out == """jobs:
@@ -1308,54 +1282,50 @@ def test_export_github(cli, config_file):
 """
 
 
-def test_export_wrong_path(cli):
+def test_export_wrong_path(invoke_fast):
     """Test the case where a non-existent file is passed to --export."""
-    res = cli.invoke(build_magic, ['--export', '/tmp/dummy', 'gitlab'])
-    out = res.output
-    assert res.exit_code == ExitCode.INPUT_ERROR
+    code, out = invoke_fast(['--export', '/tmp/dummy', 'gitlab'])
+    assert code == ExitCode.INPUT_ERROR
     assert out == "[Errno 2] No such file or directory: '/tmp/dummy'\n"
 
 
-def test_export_bad_ci_type(cli, config_file):
+def test_export_bad_ci_type(config_file, invoke_fast):
     """Test the case where a bad ci type is provided to --export."""
-    res = cli.invoke(build_magic, ['--export', config_file, 'dummy'])
-    out = res.output
-    assert res.exit_code == ExitCode.INPUT_ERROR
+    code, out = invoke_fast(['--export', config_file, 'dummy'])
+    assert code == ExitCode.INPUT_ERROR
     assert out == "Export type must be one of ('github', 'gitlab')\n"
 
 
-def test_export_path_is_directory(cli, magic_dir):
+def test_export_path_is_directory(invoke_fast, magic_dir):
     """Test the case where the path provided to --export is a directory."""
-    res = cli.invoke(build_magic, ['--export', magic_dir, 'gitlab'])
-    out = res.output
-    assert res.exit_code == ExitCode.INPUT_ERROR
+    code, out = invoke_fast(['--export', magic_dir, 'gitlab'])
+    assert code == ExitCode.INPUT_ERROR
     assert '[Errno 21] Is a directory' in out
 
 
-def test_export_not_a_config_file(cli, dotenv_config):
+def test_export_not_a_config_file(dotenv_config, invoke_fast):
     """Test the case where a file that isn't a config file is provided to --export."""
     file = dotenv_config / 'test.env'
-    res = cli.invoke(build_magic, ['--export', file, 'gitlab'])
-    out = res.output
-    assert res.exit_code == ExitCode.INPUT_ERROR
+    code, out = invoke_fast(['--export', file, 'gitlab'])
+    assert code == ExitCode.INPUT_ERROR
     assert out == 'Cannot read config.\n'
 
 
-def test_validate_config_file(cli, default_config):
+def test_validate_config_file(build_magic_cmd, cli, default_config):
     """Verify the --validate switch works correctly."""
-    res = cli.invoke(build_magic, ['--validate', default_config])
+    res = cli.invoke(build_magic_cmd, ['--validate', default_config])
     out = res.output
     assert res.exit_code == ExitCode.PASSED
     assert out == ''
 
 
-def test_validate_config_file_fail(cli, invalid_config):
+def test_validate_config_file_fail(build_magic_cmd, cli, invalid_config):
     """Test the case where a config file fails validation using the --validate switch."""
     ref = """Config validation failed: {'execute': 'echo "hello"'} is not of type 'array'
 
 Failed validating 'type' in schema[0]['properties']['stage']['properties']['commands']
 """
-    res = cli.invoke(build_magic, ['--validate', invalid_config])
+    res = cli.invoke(build_magic_cmd, ['--validate', invalid_config])
     out = res.output
     assert res.exit_code == ExitCode.INPUT_ERROR
     assert out == ref
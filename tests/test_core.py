@@ -1,8 +1,10 @@
 """This module hosts unit tests for the core classes."""
 
+import contextlib
+import io
 import json
-import os
-import pathlib
+import platform
+import re
 
 import jsonschema
 import pytest
@@ -15,22 +17,237 @@ from build_magic.core import (
 from build_magic.exc import ExecutionError, SetupError, TeardownError, NoJobs, ValidationError
 from build_magic.macro import Macro
 from build_magic.reference import ExitCode, KeyPath, KeyType
-from build_magic.runner import Local
+from build_magic.runner import Local, Status
+from . import STATIC
+
+
+CAT = Macro('cat')
+
+
+ECHO_HELLO = Macro(prefix='echo', command='hello')
+
+
+LS = Macro('ls')
+
+
+if platform.system() == 'Windows':
+    CP_COMMAND = 'copy'
+    LS_COMMAND = 'dir'
+else:
+    CP_COMMAND = 'cp'
+    LS_COMMAND = 'ls'
+
+
+STAGE_MACROS = {'cp': Macro(CP_COMMAND), 'echo': ECHO_HELLO, 'ls': Macro(LS_COMMAND)}
+
+
+UNSORTED_STAGES = [
+    Stage(Local(), [ECHO_HELLO], ['execute'], 1, 'default'),
+    Stage(Local(), [LS, CAT], ['execute', 'execute'], 0, 'default'),
+    Stage(Local(), [], [], 2, 'default'),
+]
+
+
+BUILD_ARGS = {
+    'sequence': 0,
+    'runner_type': 'local',
+    'directives': ['execute'],
+    'artifacts': None,
+    'commands': ['ls'],
+    'environment': '',
+    'action': 'default',
+    'copy': '.',
+    'wd': '.',
+}
+
+
+GO_VARIABLES = {'OS': 'linux', 'ARCH': 'arm64'}
+
+
+GO_COMMANDS = (('execute', 'export GOARCH={{ ARCH }}'), ('execute', 'export GOOS={{ OS }}'))
+
+
+VERSION_VARIABLES = {'user': 'max', 'pass': 'dummy', 'version': '2.2.2'}
+
+
+VERSION_COMMANDS = (
+    ('execute', 'prep.sh --version 2.2.2'),
+    ('build', 'build.sh --u max --pass dummy --version 2.2.2'),
+    ('install', 'docker build -t test:2.2.2 .'),
+)
+
+
+def parsed_stage(**kwargs):
+    """Builds the stage dictionary returned by config_parser, with the defaults replaced by any keyword arguments."""
+    stage = {
+        'name': '',
+        'description': '',
+        'runner_type': 'local',
+        'environment': '',
+        'continue': False,
+        'wd': '.',
+        'copy': '',
+        'artifacts': [],
+        'action': 'default',
+        'commands': [],
+        'directives': [],
+        'labels': [],
+        'dotenv': '',
+        'parameters': [],
+        'environment variables': {},
+    }
+    stage.update(kwargs)
+    return stage
+
+
+CONFIG_DOCKER = {
+    'build-magic': [
+        {
+            'stage': {
+                'name': 'stage 1',
+                'description': 'This is a test',
+                'action': 'persist',
+                'continue on fail': True,
+                'runner': 'docker',
+                'environment': 'alpine:latest',
+                'copy from directory': '/src',
+                'artifacts': [
+                    'file1.txt',
+                    'file2.txt',
+                ],
+                'commands': [
+                    {'build': 'tar -czf myfiles.tar.gz file1.txt file2.txt'},
+                    {'execute': 'rm file1.txt file2.txt'},
+                ]
+            }
+        },
+        {
+            'stage': {
+                'name': 'stage 2',
+                'action': 'cleanup',
+                'working directory': '/src',
+                'commands': [
+                    {'install': 'tar -xzf myfiles.tar.gz'},
+                    {'execute': 'rm myfiles.tar.gz'},
+                    {'deploy': 'cat file1.txt file2.txt'},
+                    {'release': 'git push origin main'},
+                ]
+            }
+        }
+    ]
+}
+
+
+REF_DOCKER = [
+    parsed_stage(
+        name='stage 1',
+        description='This is a test',
+        runner_type='docker',
+        environment='alpine:latest',
+        copy='/src',
+        artifacts=['file1.txt', 'file2.txt'],
+        action='persist',
+        commands=['tar -czf myfiles.tar.gz file1.txt file2.txt', 'rm file1.txt file2.txt'],
+        directives=['build', 'execute'],
+        labels=['', ''],
+        **{'continue': True},
+    ),
+    parsed_stage(
+        name='stage 2',
+        wd='/src',
+        action='cleanup',
+        commands=['tar -xzf myfiles.tar.gz', 'rm myfiles.tar.gz', 'cat file1.txt file2.txt', 'git push origin main'],
+        directives=['install', 'execute', 'deploy', 'release'],
+        labels=['', '', '', ''],
+    ),
+]
+
+
+CONFIG_REMOTE = {
+    'build-magic': [
+        {
+            'stage': {
+                'runner': 'remote',
+                'environment': 'user@myhost:2222',
+                'parameters': {
+                    'keytype': 'ecdsa',
+                    'keypath': '$HOME/user/.ssh/key_ecdsa',
+                    'keypass': '"1234"',
+                },
+                'commands': [
+                    {'test': 'ls'},
+                ]
+            }
+        }
+    ]
+}
+
+
+REF_REMOTE = [
+    parsed_stage(
+        runner_type='remote',
+        environment='user@myhost:2222',
+        commands=['ls'],
+        directives=['test'],
+        labels=[''],
+        parameters=[
+            ('keytype', 'ecdsa'),
+            ('keypath', '$HOME/user/.ssh/key_ecdsa'),
+            ('keypass', '"1234"'),
+        ],
+    ),
+]
 
 
 @pytest.fixture
 def config_schema():
     """Provides a config schema for testing."""
-    schema_path = pathlib.Path(__file__).parent.parent / 'build_magic' / 'static' / 'config_schema.json'
-    with open(schema_path, 'r') as file:
+    with open(STATIC / 'config_schema.json', 'r') as file:
         schema = json.load(file)
     return schema
 
 
-def test_stage_constructor():
-    """Verify the Stage constructor works correctly."""
-    args = (Local(), [Macro('ls')], ['execute'], 1, 'default')
-    stage = Stage(*args)
+@pytest.fixture
+def null_action(monkeypatch, request):
+    """Patches the null setup and teardown action to return each of the parametrized results in turn."""
+    results = iter(request.param)
+    monkeypatch.setattr('build_magic.actions.null', lambda self: next(results))
+
+
+@pytest.fixture
+def generated_template(monkeypatch, tmp_path):
+    """Provides a config file template generated in a temporary current directory that pytest cleans up."""
+    monkeypatch.chdir(tmp_path)
+    return generate_config_template()
+
+
+@pytest.fixture
+def fake_execute(monkeypatch):
+    """Replaces command execution by the local runner with a status that only fails for the copy command."""
+    def execute(self, macro):
+        return Status(exit_code=1 if macro.command == CP_COMMAND else 0)
+
+    monkeypatch.setattr(Local, 'execute', execute)
+
+
+@pytest.fixture(scope='module')
+def local_runner():
+    """Provides a Local command runner shared by tests that only construct a Stage."""
+    return Local()
+
+
+@pytest.fixture(scope='module')
+def default_stage_args(local_runner):
+    """Provides the Stage arguments shared by tests that only construct a Stage."""
+    return local_runner, [LS], ['execute'], 1, 'default'
+
+
+def assert_default_stage(stage, sequence):
+    """Asserts that a Stage holds a single ls command for the local runner and hasn't been set up or run.
+
+    :param Stage stage: The Stage to check.
+    :param int sequence: The expected Stage sequence number.
+    """
     assert isinstance(stage._command_runner, Local)
     assert isinstance(stage.command_runner, Local)
     assert stage._action is Default
@@ -39,24 +256,30 @@ def test_stage_constructor():
     assert stage._macros[0].command == 'ls'
     assert stage._result == 0
     assert stage._results == []
-    assert stage.sequence == 1
+    assert stage.sequence == sequence
     assert not stage.is_setup
-    assert stage._name == ''
-    assert stage._description == ''
+    assert stage.name == ''
+    assert stage.description == ''
     assert stage.skip is False
 
 
-def test_stage_constructor_invalid_action():
+def test_stage_constructor(default_stage_args):
+    """Verify the Stage constructor works correctly."""
+    stage = Stage(*default_stage_args)
+    assert_default_stage(stage, 1)
+
+
+def test_stage_constructor_invalid_action(default_stage_args):
     """Test the case where an invalid action is passed to the Stage constructor."""
-    args = (Local(), [Macro('ls')], ['execute'], 1, 'dummy')
+    args = (*default_stage_args[:-1], 'dummy')
     with pytest.raises(ValueError, match='Action must be one of'):
         Stage(*args)
 
 
-def test_stage_setup(mocker):
+def test_stage_setup(monkeypatch):
     """Verify the Stage setup() method works correctly."""
-    mocker.patch('build_magic.runner.Local.prepare', return_value=True)
-    args = (Local(), [Macro('ls')], ['execute'], 1, 'default')
+    monkeypatch.setattr(Local, 'prepare', lambda self: True)
+    args = (Local(), [LS], ['execute'], 1, 'default')
     stage = Stage(*args)
     assert hasattr(stage._command_runner, 'provision')
     assert hasattr(stage._command_runner, 'teardown')
@@ -68,124 +291,81 @@ def test_stage_setup(mocker):
     assert stage._command_runner.teardown() is True
 
 
-def test_stage_run(capsys, ls):
-    """Verify the Stage run() method works correctly."""
-    args = (Local(), [Macro(ls)], ['execute'], 1, 'default')
-    stage = Stage(*args)
-    assert stage.is_setup is False
-    exit_code = stage.run()
-    capsys.readouterr()
-    assert exit_code == 0
-    assert len(stage._results) == 1
-    assert stage.is_setup is True
-
-
-def test_stage_run_multiple(capsys, ls):
-    """Verify the stage run() method works correctly with multiple commands."""
-    macros = [Macro(ls), Macro(prefix='echo', command='hello'), Macro(ls)]
-    args = (Local(), macros, ['execute'], 1, 'default')
+@pytest.mark.usefixtures('fake_execute')
+@pytest.mark.parametrize(
+    ('commands', 'continue_on_fail', 'code', 'results'),
+    [
+        (['ls'], False, 0, 1),
+        (['ls', 'echo', 'ls'], False, 0, 3),
+        (['cp'], False, 1, 1),
+        (['ls', 'echo', 'cp'], False, 1, 3),
+        (['ls', 'cp', 'echo'], False, 1, 2),
+        (['ls', 'cp', 'echo'], True, 1, 3),
+    ]
+)
+def test_stage_run(capsys, code, commands, continue_on_fail, results):
+    """Verify the Stage run() method works correctly with passing, failing, and continued commands."""
+    args = (Local(), [STAGE_MACROS[command] for command in commands], ['execute'] * len(commands), 1, 'default')
     stage = Stage(*args)
     assert stage.is_setup is False
-    exit_code = stage.run()
+    exit_code = stage.run(continue_on_fail=continue_on_fail)
     capsys.readouterr()
-    assert exit_code == 0
-    assert len(stage._results) == 3
+    assert exit_code == code
+    assert len(stage._results) == results
     assert stage.is_setup is True
 
 
-def test_stage_run_setup_fail(capsys, mocker):
-    """Test the case where the Stage run() method raises a SetupError."""
-    mocker.patch('build_magic.actions.null', return_value=False)
-    args = (Local(), [Macro('ls')], ['execute'], 1, 'default')
-    stage = Stage(*args)
-    with pytest.raises(SetupError, match='Setup failed'):
-        stage.run()
-        capsys.readouterr()
-
-
-def test_stage_run_teardown_fail(capsys, mocker):
-    """Test the case where the Stage run() method raises a TeardownError."""
-    mocker.patch('build_magic.actions.null', side_effect=(True, False))
-    args = (Local(), [Macro('ls')], ['execute'], 1, 'default')
+@pytest.mark.shell
+@pytest.mark.parametrize(
+    ('null_action', 'error', 'message'),
+    [
+        ((False,), SetupError, 'Setup failed'),
+        ((True, False), TeardownError, 'Teardown failed'),
+    ],
+    indirect=['null_action'],
+)
+def test_stage_run_action_fail(capsys, error, message, null_action):
+    """Test the cases where the Stage run() method raises a SetupError or TeardownError."""
+    args = (Local(), [LS], ['execute'], 1, 'default')
     stage = Stage(*args)
-    with pytest.raises(TeardownError, match='Teardown failed'):
+    with pytest.raises(error, match=message):
         stage.run()
     capsys.readouterr()
 
 
-def test_stage_run_fail(capsys):
-    """Test the case where the command executed by the run() method returns a non-zero exit code."""
-    args = (Local(), [Macro('cp')], ['execute'], 1, 'default')
-    stage = Stage(*args)
-    exit_code = stage.run()
-    capsys.readouterr()
-    assert exit_code > 0
-
-
-def test_stage_run_exception(capsys, ls, mocker):
+def test_stage_run_exception(capsys, monkeypatch):
     """Test the case where the command raises an Exception."""
-    mocker.patch('build_magic.runner.Local.execute', side_effect=RuntimeError)
-    args = (Local(), [Macro(ls)], ['execute'], 1, 'default')
+    def execute(self, macro):
+        raise RuntimeError
+
+    monkeypatch.setattr(Local, 'execute', execute)
+    args = (Local(), [STAGE_MACROS['ls']], ['execute'], 1, 'default')
     stage = Stage(*args)
     with pytest.raises(ExecutionError, match='Command execution error'):
         stage.run()
     capsys.readouterr()
 
 
-def test_stage_run_multiple_fail(capsys, ls):
-    """Test the case where multiple commands are run and the last one returns a non-zero exit code."""
-    macros = [Macro(ls), Macro(prefix='echo', command='hello'), Macro('cp')]
-    args = (Local(), macros, ['execute'], 1, 'default')
-    stage = Stage(*args)
-    assert stage.is_setup is False
-    exit_code = stage.run()
-    capsys.readouterr()
-    assert exit_code == 1
-    assert len(stage._results) == 3
-
-
-def test_stage_run_multiple_fail_2(capsys, ls):
-    """Test the case where multiple commands are run and execution halts with a command in the middle."""
-    macros = [Macro(ls), Macro('cp'), Macro(prefix='echo', command='hello')]
-    args = (Local(), macros, ['execute'], 1, 'default')
-    stage = Stage(*args)
-    assert stage.is_setup is False
-    exit_code = stage.run()
-    capsys.readouterr()
-    assert exit_code == 1
-    assert len(stage._results) == 2
-
-
-def test_stage_run_multiple_continue_on_fail(capsys, cp, ls):
-    """Test the case where multiple commands are run, one fails, but execution continues."""
-    macros = [Macro(ls), Macro(cp), Macro(prefix='echo', command='hello')]
-    args = (Local(), macros, ['execute'], 1, 'default')
-    stage = Stage(*args)
-    assert stage.is_setup is False
-    exit_code = stage.run(continue_on_fail=True)
-    capsys.readouterr()
-    assert exit_code == 1
-    assert len(stage._results) == 3
-
-
-def test_stage_run_verbose(capsys):
+@pytest.mark.shell
+def test_stage_run_verbose():
     """Verify the Stage run() method handles verbose mode correctly."""
-    args = (Local(), [Macro('echo hello')], ['execute'], 1, 'default',)
+    args = (Local(), [ECHO_HELLO], ['execute'], 1, 'default',)
     stage = Stage(*args, name='Test', description='This is a test')
     assert stage.is_setup is False
-    exit_code = stage.run(verbose=True)
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        exit_code = stage.run(verbose=True)
     assert exit_code == 0
     assert len(stage._results) == 1
     assert stage.is_setup is True
     assert stage.name == 'Test'
     assert stage.description == 'This is a test'
-    captured = capsys.readouterr()
-    assert '\nOUTPUT: hello\n' in captured.out
+    assert '\nOUTPUT: hello\n' in out.getvalue()
 
 
 def test_stage_run_skip(capsys):
     """Verify the Stage run() method handles skipping correctly."""
-    args = (Local(), [Macro('echo hello')], ['execute'], 1, 'default')
+    args = (Local(), [ECHO_HELLO], ['execute'], 1, 'default')
     stage = Stage(*args, name='Test', description='This is a test', skip=True)
     assert stage.skip is True
     exit_code = stage.run(verbose=True)
@@ -196,82 +376,35 @@ def test_stage_run_skip(capsys):
 
 def test_stagefactory_build():
     """Verify the StageFactory build() method works correctly."""
-    args = (0, 'local', ['execute'], None, ['ls'], '', 'default', '.', '.')
-    stage = StageFactory.build(*args)
-    assert isinstance(stage._command_runner, Local)
-    assert stage._action is Default
-    assert stage._directives == ['execute']
-    assert isinstance(stage._macros[0], Macro)
-    assert stage._macros[0].command == 'ls'
-    assert stage.name == ''
-    assert stage.description == ''
-    assert stage._result == 0
-    assert stage._results == []
-    assert stage.sequence == 0
-    assert not stage.is_setup
-
-
-def test_stagefactory_build_invalid_runner():
-    """Test the case where an invalid runner is passed to the StageFactory build() method."""
-    args = (0, 'dummy', ['execute'], None, ['ls'], '', 'default', '.', '.')
-    with pytest.raises(ValueError, match='Runner must be one of'):
-        StageFactory.build(*args)
-
-
-def test_stagefactory_build_invalid_directive():
-    """Test the case where an invalid directive is passed to the StageFactory build() method."""
-    args = (0, 'local', ['dummy'], None, ['ls'], '', 'default', '.', '.')
-    with pytest.raises(ValueError, match='Directive must be one of'):
-        StageFactory.build(*args)
-
-
-def test_stagefactory_build_no_jobs(capsys):
-    """Test the case where no jobs a passed to the StageFactory build() method."""
-    args = (0, 'local', ['execute'], None, [], '', 'default', '.', '.')
-    with pytest.raises(NoJobs, match='No jobs to execute'):
-        StageFactory.build(*args)
+    stage = StageFactory.build(**BUILD_ARGS)
+    assert_default_stage(stage, 0)
+
+
+@pytest.mark.parametrize(
+    ('options', 'error', 'message'),
+    [
+        ({'runner_type': 'dummy'}, ValueError, re.compile('Runner must be one of')),
+        ({'directives': ['dummy']}, ValueError, re.compile('Directive must be one of')),
+        ({'commands': []}, NoJobs, re.compile('No jobs to execute')),
+        ({'runner_type': 'docker'}, ValueError, re.compile('Environment must be a Docker image')),
+        ({'runner_type': 'vagrant'}, ValueError, re.compile('Environment must be a path to a Vagrant file')),
+        ({'copy': 'dummy'}, NotADirectoryError, re.compile('Path dummy does not exist')),
+        (
+            {'directives': ['execute', 'build']},
+            ValueError,
+            re.compile('Length of commands unequal to length of directives.'),
+        ),
+        ({'action': 'dummy'}, ValueError, re.compile('Action must be one of')),
+        ({'labels': ['label1', 'label2']}, ValueError, re.compile('Length of commands unequal to length of labels')),
+    ]
+)
+def test_stagefactory_build_fail(capsys, error, message, options):
+    """Test the cases where invalid arguments are passed to the StageFactory build() method."""
+    with pytest.raises(error, match=message):
+        StageFactory.build(**{**BUILD_ARGS, **options})
     capsys.readouterr()
 
 
-def test_stagefactory_build_invalid_environment():
-    """Test the case where an invalid environment is passed to the StageFactory build() method."""
-    args = (0, 'docker', ['execute'], None, ['ls'], '', 'default', '.', '.')
-    with pytest.raises(ValueError, match='Environment must be a Docker image'):
-        StageFactory.build(*args)
-
-    args = (0, 'vagrant', ['execute'], None, ['ls'], '', 'default', '.', '.')
-    with pytest.raises(ValueError, match='Environment must be a path to a Vagrant file'):
-        StageFactory.build(*args)
-
-
-def test_stagefactory_build_invalid_copy_directory():
-    """Test the case where a non-existent copy directory is passed to the StageFactory build() method."""
-    args = (0, 'local', ['execute'], None, ['ls'], '', 'default', 'dummy', '.')
-    with pytest.raises(NotADirectoryError, match='Path dummy does not exist'):
-        StageFactory.build(*args)
-
-
-def test_stagefactory_build_unequal_directives_and_commands():
-    """Test the case where the number of commands is unequal to the number of directives."""
-    args = (0, 'local', ['execute', 'build'], None, ['ls'], '', 'default', '.', '.')
-    with pytest.raises(ValueError, match='Length of commands unequal to length of directives.'):
-        StageFactory.build(*args)
-
-
-def test_stagefactory_build_invalid_action():
-    """Test the case where an invalid action is passed to the StageFactory build() method."""
-    args = (0, 'local', ['execute'], None, ['ls'], '', 'dummy', '.', '.')
-    with pytest.raises(ValueError, match='Action must be one of'):
-        StageFactory.build(*args)
-
-
-def test_stagefactory_inequal_commands_and_label_lengths():
-    """Test the case where a different number of labels is provided compared to commands."""
-    args = (0, 'local', ['execute'], None, ['ls'], '', 'default', '.', '.', None, None, None, ['label1', 'label2'])
-    with pytest.raises(ValueError, match='Length of commands unequal to length of labels'):
-        StageFactory.build(*args)
-
-
 def test_stagefactory_build_parameters():
     """Verify the StageFactory _build_parameters() class method works correctly."""
     ref = {
@@ -299,14 +432,8 @@ def test_stagefactory_build_parameters_validation_fail():
 
 def test_engine_constructor():
     """Verify the Engine constructor works correctly."""
-    stage0 = Stage(Local(), [Macro('ls'), Macro('cat')], ['execute'], 0, 'default')
-    stage1 = Stage(Local(), [Macro('echo hello')], ['execute'], 1, 'default')
-    stage2 = Stage(Local(), [], [], 2, 'default')
-
-    engine = Engine([stage1, stage0, stage2])
-    assert engine._stages[0].sequence == 0
-    assert engine._stages[1].sequence == 1
-    assert engine._stages[2].sequence == 2
+    engine = Engine(UNSORTED_STAGES)
+    assert [stage.sequence for stage in engine._stages] == [0, 1, 2]
     assert not engine._continue_on_fail
 
 
@@ -317,16 +444,10 @@ def test_engine_stage_list_type_fail():
         Engine(params)
 
 
-def test_generate_config_template():
+def test_generate_config_template(generated_template, template_ref, tmp_path):
     """Verify the generate_config_template() function works correctly."""
-    filename = 'build-magic_template.yaml'
-    template = pathlib.Path(__file__).parent.parent / 'build_magic' / 'static' / filename
-    ref = template.read_text()
-
-    config = generate_config_template()
-    content = config.read_text()
-    os.unlink(config)
-    assert content == ref
+    assert generated_template.parent == tmp_path.resolve()
+    assert generated_template.read_text() == template_ref
 
 
 def test_validate_config_against_schema(config_schema):
@@ -360,147 +481,15 @@ def test_validate_config_against_schema_fail(config_schema):
         validate_config_against_schema(config, config_schema)
 
 
-def test_config_parser():
-    """Verify the config parser works correctly."""
-    config = {
-        'build-magic': [
-            {
-                'stage': {
-                    'name': 'stage 1',
-                    'description': 'This is a test',
-                    'action': 'persist',
-                    'continue on fail': True,
-                    'runner': 'docker',
-                    'environment': 'alpine:latest',
-                    'copy from directory': '/src',
-                    'artifacts': [
-                        'file1.txt',
-                        'file2.txt',
-                    ],
-                    'commands': [
-                        {'build': 'tar -czf myfiles.tar.gz file1.txt file2.txt'},
-                        {'execute': 'rm file1.txt file2.txt'},
-                    ]
-                }
-            },
-            {
-                'stage': {
-                    'name': 'stage 2',
-                    'action': 'cleanup',
-                    'working directory': '/src',
-                    'commands': [
-                        {'install': 'tar -xzf myfiles.tar.gz'},
-                        {'execute': 'rm myfiles.tar.gz'},
-                        {'deploy': 'cat file1.txt file2.txt'},
-                        {'release': 'git push origin main'},
-                    ]
-                }
-            }
-        ]
-    }
-    ref = [
-        {
-            'name': 'stage 1',
-            'description': 'This is a test',
-            'runner_type': 'docker',
-            'environment': 'alpine:latest',
-            'continue': True,
-            'wd': '.',
-            'copy': '/src',
-            'artifacts': ['file1.txt', 'file2.txt'],
-            'action': 'persist',
-            'commands': [
-                'tar -czf myfiles.tar.gz file1.txt file2.txt',
-                'rm file1.txt file2.txt',
-            ],
-            'directives': [
-                'build',
-                'execute',
-            ],
-            'labels': ['', ''],
-            'dotenv': '',
-            'parameters': [],
-            'environment variables': {},
-        },
-        {
-            'name': 'stage 2',
-            'description': '',
-            'runner_type': 'local',
-            'environment': '',
-            'continue': False,
-            'wd': '/src',
-            'copy': '',
-            'artifacts': [],
-            'action': 'cleanup',
-            'commands': [
-                'tar -xzf myfiles.tar.gz',
-                'rm myfiles.tar.gz',
-                'cat file1.txt file2.txt',
-                'git push origin main',
-            ],
-            'directives': [
-                'install',
-                'execute',
-                'deploy',
-                'release',
-            ],
-            'labels': ['', '', '', ''],
-            'dotenv': '',
-            'parameters': [],
-            'environment variables': {},
-        }
-    ]
-    stages = config_parser(config)
-    assert stages == ref
-
-
-def test_config_parser_with_parameters():
-    """Verify the config parser handles parameters correctly."""
-    config = {
-        'build-magic': [
-            {
-                'stage': {
-                    'runner': 'remote',
-                    'environment': 'user@myhost:2222',
-                    'parameters': {
-                        'keytype': 'ecdsa',
-                        'keypath': '$HOME/user/.ssh/key_ecdsa',
-                        'keypass': '"1234"',
-                    },
-                    'commands': [
-                        {'test': 'ls'},
-                    ]
-                }
-            }
-        ]
-    }
-    ref = [
-        {
-            'name': '',
-            'description': '',
-            'runner_type': 'remote',
-            'environment': 'user@myhost:2222',
-            'continue': False,
-            'wd': '.',
-            'copy': '',
-            'artifacts': [],
-            'action': 'default',
-            'commands': [
-                'ls',
-            ],
-            'directives': [
-                'test',
-            ],
-            'labels': [''],
-            'dotenv': '',
-            'parameters': [
-                ('keytype', 'ecdsa'),
-                ('keypath', '$HOME/user/.ssh/key_ecdsa'),
-                ('keypass', '"1234"'),
-            ],
-            'environment variables': {},
-        }
+@pytest.mark.parametrize(
+    ('config', 'ref'),
+    [
+        (CONFIG_DOCKER, REF_DOCKER),
+        (CONFIG_REMOTE, REF_REMOTE),
     ]
+)
+def test_config_parser(config, ref):
+    """Verify the config parser works correctly, including stage parameters."""
     stages = config_parser(config)
     assert stages == ref
 
@@ -724,199 +713,91 @@ def test_iterative_sequence():
     assert out == [1, 2, 3, 4, 5]
 
 
-def test_parse_variables():
-    """Verify parser_variables works correctly."""
-    variables = {
-        'OS': 'linux',
-        'ARCH': 'arm64',
-    }
-    config = {
+def variables_config(commands):
+    """Builds a single stage config for testing parse_variables from a sequence of directive, command pairs."""
+    return {
         'build-magic': [
             {
                 'stage': {
                     'name': 'example',
                     'runner': 'local',
-                    'commands': [
-                        {'execute': 'export GOARCH={{ ARCH }}'},
-                        {'execute': 'export GOOS={{ OS }}'},
-                    ]
-                }
-            }
-        ]
-    }
-    output = parse_variables(config, variables)
-    assert json.dumps(output) == (
-        '{"build-magic": [{"stage": {"name": "example", "runner": "local", "commands": '
-        '[{"execute": "export GOARCH=arm64"}, {"execute": "export GOOS=linux"}]}}]}'
-    )
-
-
-def test_parse_variables_multiple_matches():
-    """Verify parser_variables works with substituting multiple instances of the same variable."""
-    variables = {
-        'user': 'max',
-        'pass': 'dummy',
-        'version': '2.2.2',
-    }
-    config = {
-        'build-magic': [
-            {
-                'stage': {
-                    'name': 'example',
-                    'commands': [
-                        {'execute': 'prep.sh --version {{ version }}'},
-                        {'build': 'build.sh --u {{ user }} --pass {{ pass }} --version {{ version }}'},
-                        {'install': 'docker build -t test:{{ version }} .'},
-                    ]
+                    'commands': [{directive: command} for directive, command in commands],
                 }
             }
         ]
     }
-    output = parse_variables(config, variables)
-    assert json.dumps(output) == (
-        '{"build-magic": [{"stage": {"name": "example", "commands": [{"execute": "prep.sh --version 2.2.2"}, '
-        '{"build": "build.sh --u max --pass dummy --version 2.2.2"}, {"install": "docker build -t test:2.2.2 ."}]}}]}'
-    )
 
 
-def test_parse_variables_different_spacing():
-    """Verify parser_variables works with inconsistent spacing around the placeholder text."""
-    variables = {
-        'user': 'max',
-        'pass': 'dummy',
-        'version': '2.2.2',
-    }
-    config = {
-        'build-magic': [
-            {
-                'stage': {
-                    'name': 'example',
-                    'commands': [
-                        {'execute': 'prep.sh --version {{version }}'},
-                        {'build': 'build.sh --u {{ user }} --pass {{pass}} --version {{ version}}'},
-                        {'install': 'docker build -t test:{{version}} .'},
-                    ]
-                }
-            }
-        ]
-    }
-    output = parse_variables(config, variables)
-    assert json.dumps(output) == (
-        '{"build-magic": [{"stage": {"name": "example", "commands": [{"execute": "prep.sh --version 2.2.2"}, '
-        '{"build": "build.sh --u max --pass dummy --version 2.2.2"}, {"install": "docker build -t test:2.2.2 ."}]}}]}'
-    )
+@pytest.mark.parametrize(
+    ('variables', 'commands', 'expected'),
+    [
+        (GO_VARIABLES, GO_COMMANDS, (('execute', 'export GOARCH=arm64'), ('execute', 'export GOOS=linux'))),
+        (
+            VERSION_VARIABLES,
+            (
+                ('execute', 'prep.sh --version {{ version }}'),
+                ('build', 'build.sh --u {{ user }} --pass {{ pass }} --version {{ version }}'),
+                ('install', 'docker build -t test:{{ version }} .'),
+            ),
+            VERSION_COMMANDS,
+        ),
+        (
+            VERSION_VARIABLES,
+            (
+                ('execute', 'prep.sh --version {{version }}'),
+                ('build', 'build.sh --u {{ user }} --pass {{pass}} --version {{ version}}'),
+                ('install', 'docker build -t test:{{version}} .'),
+            ),
+            VERSION_COMMANDS,
+        ),
+        (
+            GO_VARIABLES,
+            (('execute', 'export GOARCH={{  ARCH }}'), ('execute', 'export GOOS={{ OS     }}')),
+            (('execute', 'export GOARCH={{  ARCH }}'), ('execute', 'export GOOS={{ OS     }}')),
+        ),
+        (
+            {},
+            (('execute', 'export GOARCH=arm64'), ('execute', 'export GOOS=linux')),
+            (('execute', 'export GOARCH=arm64'), ('execute', 'export GOOS=linux')),
+        ),
+        ({}, GO_COMMANDS, GO_COMMANDS),
+    ]
+)
+def test_parse_variables(commands, expected, variables):
+    """Verify parse_variables works correctly, including placeholders with extra white space and no variables."""
+    output = parse_variables(variables_config(commands), variables)
+    assert output == variables_config(expected)
 
 
 def test_parse_variables_no_matches():
     """Test the case where there are no matches for parse_variables to substitute."""
-    variables = {
-        'user': 'max',
-        'pass': 'dummy',
-        'version': '2.2.2',
-    }
-    config = {
-        'build-magic': [
-            {
-                'stage': {
-                    'name': 'example',
-                    'runner': 'local',
-                    'commands': [
-                        {'execute': 'export GOARCH={{ ARCH }}'},
-                        {'execute': 'export GOOS={{ OS }}'},
-                    ]
-                }
-            }
-        ]
-    }
     with pytest.raises(ValueError, match='No variable matches found'):
-        parse_variables(config, variables)
+        parse_variables(variables_config(GO_COMMANDS), VERSION_VARIABLES)
 
 
-def test_parse_variables_too_much_space():
-    """Test the case where a placeholder isn't substituted by parse_variables because there's too much white space."""
+def test_parse_variables_windows_path():
+    """Test the case where a Windows path is provided as a variable."""
     variables = {
-        'OS': 'linux',
-        'ARCH': 'arm64',
-    }
-    config = {
-        'build-magic': [
-            {
-                'stage': {
-                    'name': 'example',
-                    'runner': 'local',
-                    'commands': [
-                        {'execute': 'export GOARCH={{  ARCH }}'},
-                        {'execute': 'export GOOS={{ OS     }}'},
-                    ]
-                }
-            }
-        ]
-    }
-    output = parse_variables(config, variables)
-    assert json.dumps(output) == (
-        '{"build-magic": [{"stage": {"name": "example", "runner": "local", "commands": '
-        '[{"execute": "export GOARCH={{  ARCH }}"}, {"execute": "export GOOS={{ OS     }}"}]}}]}'
-    )
-
-
-def test_parse_variables_no_variables_no_placeholders():
-    """Test the case where parse_variables isn't provided any variables or placeholders."""
-    variables = {}
-    config = {
-        'build-magic': [
-            {
-                'stage': {
-                    'name': 'example',
-                    'runner': 'local',
-                    'commands': [
-                        {'execute': 'export GOARCH=arm64'},
-                        {'execute': 'export GOOS=linux'},
-                    ]
-                }
-            }
-        ]
+        'wd': 'C:\\Users\\wanda\\repos'
     }
-    output = parse_variables(config, variables)
-    assert json.dumps(output) == (
-        '{"build-magic": [{"stage": {"name": "example", "runner": "local", "commands": '
-        '[{"execute": "export GOARCH=arm64"}, {"execute": "export GOOS=linux"}]}}]}'
-    )
-
-
-def test_parse_variables_no_variables():
-    """Test the case where parse_variables isn't provided any variables."""
-    variables = {}
     config = {
         'build-magic': [
             {
                 'stage': {
-                    'name': 'example',
-                    'runner': 'local',
+                    'working directory': "'{{ wd }}'",
                     'commands': [
-                        {'execute': 'export GOARCH={{ ARCH }}'},
-                        {'execute': 'export GOOS={{ OS }}'},
+                        {'execute': 'echo hello'}
                     ]
                 }
             }
         ]
     }
     output = parse_variables(config, variables)
-    assert json.dumps(output) == (
-        '{"build-magic": [{"stage": {"name": "example", "runner": "local", "commands": '
-        '[{"execute": "export GOARCH={{ ARCH }}"}, {"execute": "export GOOS={{ OS }}"}]}}]}'
-    )
-
-
-def test_parse_variables_windows_path():
-    """Test the case where a Windows path is provided as a variable."""
-    variables = {
-        'wd': 'C:\\Users\\wanda\\repos'
-    }
-    config = {
+    assert output == {
         'build-magic': [
             {
                 'stage': {
-                    'working directory': "'{{ wd }}'",
+                    'working directory': "'C://Users//wanda//repos'",
                     'commands': [
                         {'execute': 'echo hello'}
                     ]
@@ -924,8 +805,3 @@ def test_parse_variables_windows_path():
             }
         ]
     }
-    output = parse_variables(config, variables)
-    assert json.dumps(output) == (
-        '{"build-magic": [{"stage": {"working directory": "\'C://Users//wanda//repos\'", '
-        '"commands": [{"execute": "echo hello"}]}}]}'
-    )
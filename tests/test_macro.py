@@ -6,96 +6,42 @@ from build_magic.reference import PromptSequence
 from build_magic.macro import MacroFactory, Macro
 
 
-@pytest.fixture
-def cmd():
-    """Provides a dummy command to use for tests."""
-    return 'ls'
+PREFIX = 'cd /tmp;'
 
 
-@pytest.fixture
-def prefix():
-    """Provides a dummy command to use as a prefix for tests."""
-    return 'cd /tmp;'
-
-
-@pytest.fixture
-def suffix():
-    """Provides a dummy option to use as a suffix for tests."""
-    return '-ltr'
+SUFFIX = '-ltr'
 
 
 @pytest.fixture
-def label():
-    """Provides a dummy description to use a label for tests."""
-    return 'dummy command'
+def cmd():
+    """Provides a dummy command to use for tests."""
+    return 'ls'
 
 
-def test_macro_create(cmd):
-    """Verify creating a Macro object works as expected."""
-    macro = Macro(cmd)
+@pytest.mark.parametrize(
+    ('options', 'string', 'args'),
+    [
+        ({}, 'ls', ['ls']),
+        ({'prefix': PREFIX}, f'{PREFIX} ls', [*PREFIX.split(), 'ls']),
+        ({'suffix': SUFFIX}, f'ls {SUFFIX}', ['ls', SUFFIX]),
+        ({'prefix': PREFIX, 'suffix': SUFFIX}, f'{PREFIX} ls {SUFFIX}', [*PREFIX.split(), 'ls', SUFFIX]),
+        ({'label': 'dummy command'}, 'ls', ['ls']),
+    ]
+)
+def test_macro_create(args, cmd, options, string):
+    """Verify creating a Macro object with a prefix, suffix, or label works as expected."""
+    macro = Macro(cmd, **options)
     assert macro.sequence == 0
     assert macro._command == cmd
     assert macro.command == cmd
-    assert not macro.prefix
-    assert not macro.suffix
-    assert not macro.label
-    assert macro.as_string() == 'ls'
-    assert macro.as_list() == ['ls']
-
-
-def test_macro_create_with_prefix(cmd, prefix):
-    """Verify creating a Macro object with a prefix works as expected."""
-    macro = Macro(cmd, prefix=prefix)
-    assert macro.sequence == 0
-    assert macro._command == 'ls'
-    assert macro.command == cmd
-    assert macro.prefix == 'cd /tmp;'
-    assert not macro.suffix
-    assert not macro.label
-    assert macro.as_string() == 'cd /tmp; ls'
-    assert macro.as_list() == ['cd', '/tmp;', 'ls']
-
-
-def test_macro_create_suffix(cmd, suffix):
-    """Verify creating a Macro object with a suffix works as expected."""
-    macro = Macro(cmd, suffix=suffix)
-    assert macro.sequence == 0
-    assert macro._command == 'ls'
-    assert macro.command == cmd
-    assert not macro.prefix
-    assert macro.suffix == '-ltr'
-    assert not macro.label
-    assert macro.as_string() == 'ls -ltr'
-    assert macro.as_list() == ['ls', '-ltr']
+    assert macro.prefix == options.get('prefix', '')
+    assert macro.suffix == options.get('suffix', '')
+    assert macro.label == options.get('label', '')
+    assert macro.as_string() == string
+    assert macro.as_list() == args
 
 
-def test_macro_create_prefix_suffix(cmd, prefix, suffix):
-    """Verify creating a Macro with a prefix and suffix works as expected."""
-    macro = Macro(cmd, prefix=prefix, suffix=suffix)
-    assert macro.sequence == 0
-    assert macro._command == 'ls'
-    assert macro.command == cmd
-    assert macro.prefix == 'cd /tmp;'
-    assert macro.suffix == '-ltr'
-    assert not macro.label
-    assert macro.as_string() == 'cd /tmp; ls -ltr'
-    assert macro.as_list() == ['cd', '/tmp;', 'ls', '-ltr']
-
-
-def test_macro_create_label(cmd, label):
-    """Verify creating a Macro with a label works as expected."""
-    macro = Macro(cmd, label=label)
-    assert macro.sequence == 0
-    assert macro._command == 'ls'
-    assert macro.command == cmd
-    assert not macro.prefix
-    assert not macro.suffix
-    assert macro.label == 'dummy command'
-    assert macro.as_string() == 'ls'
-    assert macro.as_list() == ['ls']
-
-
-def test_macro_add_prefix(cmd, prefix):
+def test_macro_add_prefix(cmd):
     """Verify adding a prefix to a Macro object after creation works as expected."""
     macro = Macro(cmd)
     assert macro.sequence == 0
@@ -106,13 +52,13 @@ def test_macro_add_prefix(cmd, prefix):
     assert macro.as_string() == 'ls'
     assert macro.as_list() == ['ls']
 
-    macro.prefix = prefix
-    assert macro.prefix == 'cd /tmp;'
-    assert macro.as_string() == 'cd /tmp; ls'
-    assert macro.as_list() == ['cd', '/tmp;', 'ls']
+    macro.prefix = PREFIX
+    assert macro.prefix == PREFIX
+    assert macro.as_string() == f'{PREFIX} ls'
+    assert macro.as_list() == [*PREFIX.split(), 'ls']
 
 
-def test_macro_add_suffix(cmd, suffix):
+def test_macro_add_suffix(cmd):
     """Verify adding a suffix to a Macro object after creation works as expected."""
     macro = Macro(cmd)
     assert macro.sequence == 0
@@ -123,10 +69,10 @@ def test_macro_add_suffix(cmd, suffix):
     assert macro.as_string() == 'ls'
     assert macro.as_list() == ['ls']
 
-    macro.suffix = suffix
-    assert macro.suffix == '-ltr'
-    assert macro.as_string() == 'ls -ltr'
-    assert macro.as_list() == ['ls', '-ltr']
+    macro.suffix = SUFFIX
+    assert macro.suffix == SUFFIX
+    assert macro.as_string() == f'ls {SUFFIX}'
+    assert macro.as_list() == ['ls', SUFFIX]
 
 
 def test_macro_prompted_command():
@@ -165,82 +111,49 @@ def test_macro_invalid_prefix(cmd):
         macro.as_list()
 
 
-def test_macro_factory_single_command(cmd):
-    """Verify the MacroFactor generate method works as expected."""
-    commands = [cmd]
-    factory = MacroFactory(commands)
-    assert factory._commands == (('', 'ls', '', ''),)
-    macros = factory.generate()
-    assert len(macros) == 1
-    assert macros[0].as_string() == 'ls'
-    assert macros[0].sequence == 1
-
-
-def test_macro_factory_single_command_with_suffix(cmd):
-    """Verify the MacroFactory generate method handles suffixes as expected."""
-    suffixes = ['dummy.docx dummy.xlsx']
-    commands = [cmd]
-    factory = MacroFactory(commands, suffixes=suffixes)
-    assert factory._commands == (('', 'ls', 'dummy.docx dummy.xlsx', ''),)
-    macros = factory.generate()
-    assert len(macros) == 1
-    assert macros[0].as_string() == 'ls dummy.docx dummy.xlsx'
-
-
-def test_macro_factory_single_command_with_label(cmd, label):
-    """Verify the MacroFactory generate method handles labels as expected."""
-    commands = [cmd]
-    factory = MacroFactory(commands, labels=[label])
-    assert factory._commands == (('', 'ls', '', 'dummy command'),)
-    macros = factory.generate()
-    assert len(macros) == 1
-    assert macros[0].as_string() == 'ls'
-
-
-def test_macro_factory_multiple_commands():
-    """Verify the MacroFactory generates multiple Macro objects as expected."""
-    commands = ['cd /build_magic', 'make']
-    suffixes = ['', 'artifact1 artifact2 artifact3']
-    factory = MacroFactory(commands, suffixes=suffixes)
-    assert factory._commands == (('', 'cd /build_magic', '', ''), ('', 'make', 'artifact1 artifact2 artifact3', ''))
-    macros = factory.generate()
-    assert len(macros) == 2
-    assert macros[0].as_string() == 'cd /build_magic'
-    assert macros[1].as_string() == 'make artifact1 artifact2 artifact3'
-    assert [1, 2] == [m.sequence for m in macros]
-
-
-def test_macro_factory_multiple_commands_2():
-    """Test the case where the number of commands passed to the MacroFactory are unequal to the suffixes."""
-    commands = ['mkdir', 'rm dir1', 'rm dir2', 'rm dir3']
-    suffixes = ['dir1 dir2 dir3']
-    factory = MacroFactory(commands, suffixes=suffixes)
-    assert factory._commands == (
-        ('', 'mkdir', 'dir1 dir2 dir3', ''),
-        ('', 'rm dir1', '', ''),
-        ('', 'rm dir2', '', ''),
-        ('', 'rm dir3', '', ''),
-    )
-    macros = factory.generate()
-    assert len(macros) == 4
-    assert macros[0].as_string() == 'mkdir dir1 dir2 dir3'
-    assert macros[1].as_string() == 'rm dir1'
-    assert macros[2].as_string() == 'rm dir2'
-    assert macros[3].as_string() == 'rm dir3'
-    assert [1, 2, 3, 4] == [m.sequence for m in macros]
-
-
-def test_macro_factory_multiple_commands_3():
-    """Test the case where the number of commands has an equal number of suffixes and prefixes."""
-    commands = ['b', 'e', 'h']
-    prefixes = ['a', 'd', 'g']
-    suffixes = ['c', 'f', 'i']
-    factory = MacroFactory(commands, prefixes=prefixes, suffixes=suffixes)
+@pytest.mark.parametrize(
+    ('commands', 'options', 'ref', 'strings'),
+    [
+        (['ls'], {}, (('', 'ls', '', ''),), ['ls']),
+        (
+            ['ls'],
+            {'suffixes': ['dummy.docx dummy.xlsx']},
+            (('', 'ls', 'dummy.docx dummy.xlsx', ''),),
+            ['ls dummy.docx dummy.xlsx'],
+        ),
+        (['ls'], {'labels': ['dummy command']}, (('', 'ls', '', 'dummy command'),), ['ls']),
+        (
+            ['cd /build_magic', 'make'],
+            {'suffixes': ['', 'artifact1 artifact2 artifact3']},
+            (('', 'cd /build_magic', '', ''), ('', 'make', 'artifact1 artifact2 artifact3', '')),
+            ['cd /build_magic', 'make artifact1 artifact2 artifact3'],
+        ),
+        (
+            ['mkdir', 'rm dir1', 'rm dir2', 'rm dir3'],
+            {'suffixes': ['dir1 dir2 dir3']},
+            (
+                ('', 'mkdir', 'dir1 dir2 dir3', ''),
+                ('', 'rm dir1', '', ''),
+                ('', 'rm dir2', '', ''),
+                ('', 'rm dir3', '', ''),
+            ),
+            ['mkdir dir1 dir2 dir3', 'rm dir1', 'rm dir2', 'rm dir3'],
+        ),
+        (
+            ['b', 'e', 'h'],
+            {'prefixes': ['a', 'd', 'g'], 'suffixes': ['c', 'f', 'i']},
+            (('a', 'b', 'c', ''), ('d', 'e', 'f', ''), ('g', 'h', 'i', '')),
+            ['a b c', 'd e f', 'g h i'],
+        ),
+    ]
+)
+def test_macro_factory(commands, options, ref, strings):
+    """Verify the MacroFactory generate method handles prefixes, suffixes, labels, and multiple commands as expected."""
+    factory = MacroFactory(commands, **options)
+    assert factory._commands == ref
     macros = factory.generate()
-    assert macros[0].as_string() == 'a b c'
-    assert macros[1].as_string() == 'd e f'
-    assert macros[2].as_string() == 'g h i'
-    assert [1, 2, 3] == [m.sequence for m in macros]
+    assert [macro.as_string() for macro in macros] == strings
+    assert [macro.sequence for macro in macros] == list(range(1, len(strings) + 1))
 
 
 def test_macro_factory_no_command():
@@ -1,26 +1,69 @@
 """This module hosts unit tests for the Output classes."""
+import contextlib
+import io
 import os
 from unittest.mock import MagicMock
 
-from freezegun import freeze_time
 import pytest
+from time_machine import travel
 
 from build_magic import __version__ as version
 from build_magic.output import Basic, Output, Silent, Tty
 from build_magic.reference import OutputMethod
 
+TIMESTAMP = '2021-01-02T01:06:34'
+INFO = f'{TIMESTAMP} build-magic [ INFO  ]'
+DONE = f'{TIMESTAMP} build-magic [ DONE  ]'
+FAIL = f'{TIMESTAMP} build-magic [ FAIL  ]'
+ERROR = f'{TIMESTAMP} build-magic [ ERROR ]'
+SKIP = f'{TIMESTAMP} build-magic [ SKIP  ]'
 
-@freeze_time('2021-01-02 01:06:34')
-def test_basic_log_method(capsys):
-    """Verify the basic log() method works as expected."""
-    output = Output()
+
+@pytest.fixture(scope='module', autouse=True)
+def frozen_clock():
+    """Freezes the clock at the time in the expected output for every test in the module."""
+    with travel('2021-01-02 01:06:34', tick=False) as traveller:
+        yield traveller
+
+
+@pytest.fixture(scope='module')
+def basic():
+    """Provides a Basic output shared by the tests that don't start or end a job."""
+    return Basic()
+
+
+@pytest.fixture(scope='module')
+def silent():
+    """Provides a Silent output shared by the tests in the module."""
+    return Silent()
+
+
+@pytest.mark.parametrize(
+    'method', (
+        OutputMethod.JOB_START,
+        OutputMethod.JOB_END,
+        OutputMethod.STAGE_START,
+        OutputMethod.STAGE_END,
+        OutputMethod.NO_JOB,
+        OutputMethod.MACRO_START,
+        OutputMethod.MACRO_STATUS,
+        OutputMethod.ERROR,
+        OutputMethod.INFO,
+        OutputMethod.WORKING_DIRECTORY,
+    )
+)
+def test_output_not_implemented(method):
+    """Verify the base Output class doesn't implement the output methods."""
     with pytest.raises(NotImplementedError):
-        output.log(OutputMethod.JOB_START)
+        Output().log(method)
+
 
+def test_basic_log_method(capsys):
+    """Verify the basic log() method works as expected."""
     output = Basic()
     output.log(OutputMethod.JOB_START)
     captured = capsys.readouterr()
-    assert captured.out == f'2021-01-02T01:06:34 build-magic [ INFO  ] version {version}\n'
+    assert captured.out == f'{INFO} version {version}\n'
 
     log_output = captured.out
     output.start_job()
@@ -28,246 +71,150 @@ def test_basic_log_method(capsys):
     assert log_output == captured.out
 
 
-@freeze_time('2021-01-02 01:06:34')
-def test_basic_print_output(capsys):
+def test_basic_print_output(basic, capsys):
     """Verify the print_output() method works as expected."""
-    output = Basic()
-    output.print_output('This is a test', is_error=False)
-    captured = capsys.readouterr()
-    assert captured.out == "2021-01-02T01:06:34 build-magic [ INFO  ] OUTPUT: This is a test\n"
+    basic.print_output('This is a test', is_error=False)
+    basic.print_output(b'This is a test', is_error=False)
+    basic.print_output('This is a test', is_error=True)
+    basic.print_output(b'This is a test', is_error=True)
+    assert capsys.readouterr().out.splitlines(keepends=True) == [
+        f"{INFO} OUTPUT: This is a test\n",
+        f"{INFO} OUTPUT: This is a test\n",
+        f"{ERROR} This is a test\n",
+        f"{ERROR} This is a test\n",
+    ]
 
-    output.print_output(b'This is a test', is_error=False)
-    captured = capsys.readouterr()
-    assert captured.out == "2021-01-02T01:06:34 build-magic [ INFO  ] OUTPUT: This is a test\n"
-
-    output.print_output('This is a test', is_error=True)
-    captured = capsys.readouterr()
-    assert captured.out == "2021-01-02T01:06:34 build-magic [ ERROR ] This is a test\n"
 
-    output.print_output(b'This is a test', is_error=True)
-    captured = capsys.readouterr()
-    assert captured.out == "2021-01-02T01:06:34 build-magic [ ERROR ] This is a test\n"
-
-
-@freeze_time('2021-01-02 01:06:34')
 def test_basic_end_job(capsys):
     """Verify the basic end_job() method works as expected."""
-    output = Output()
-    with pytest.raises(NotImplementedError):
-        output.log(OutputMethod.JOB_END)
-
     output = Basic()
     output.log(OutputMethod.JOB_END)
     captured = capsys.readouterr()
-    assert captured.out == '2021-01-02T01:06:34 build-magic [ INFO  ] Finished\n'
+    assert captured.out == f'{INFO} Finished\n'
 
 
-@freeze_time('2021-01-02 01:06:34')
-def test_basic_start_stage(capsys):
+def test_basic_start_stage(basic, capsys):
     """Verify the basic start_stage() method works as expected."""
-    output = Output()
-    with pytest.raises(NotImplementedError):
-        output.log(OutputMethod.STAGE_START)
-
-    output = Basic()
     # Default stage number.
-    output.log(OutputMethod.STAGE_START)
-    captured = capsys.readouterr()
-    assert captured.out == '2021-01-02T01:06:34 build-magic [ INFO  ] Starting Stage 1\n'
-
+    basic.log(OutputMethod.STAGE_START)
     # Assigned stage number.
-    output.log(OutputMethod.STAGE_START, 7)
-    captured = capsys.readouterr()
-    assert captured.out == '2021-01-02T01:06:34 build-magic [ INFO  ] Starting Stage 7\n'
-
+    basic.log(OutputMethod.STAGE_START, 7)
     # Assign stage name.
-    output.log(OutputMethod.STAGE_START, 7, 'test stage')
-    captured = capsys.readouterr()
-    assert captured.out == '2021-01-02T01:06:34 build-magic [ INFO  ] Starting Stage 7: test stage\n'
-
+    basic.log(OutputMethod.STAGE_START, 7, 'test stage')
     # Assign stage description.
-    output.log(OutputMethod.STAGE_START, 7, description='This is a test')
-    captured = capsys.readouterr()
-    assert captured.out == '2021-01-02T01:06:34 build-magic [ INFO  ] Starting Stage 7 - This is a test\n'
-
+    basic.log(OutputMethod.STAGE_START, 7, description='This is a test')
     # Assign stage name and description.
-    output.log(OutputMethod.STAGE_START, 7, 'test stage', 'This is a test')
-    captured = capsys.readouterr()
-    assert captured.out == '2021-01-02T01:06:34 build-magic [ INFO  ] Starting Stage 7: test stage - This is a test\n'
+    basic.log(OutputMethod.STAGE_START, 7, 'test stage', 'This is a test')
+    assert capsys.readouterr().out.splitlines(keepends=True) == [
+        f'{INFO} Starting Stage 1\n',
+        f'{INFO} Starting Stage 7\n',
+        f'{INFO} Starting Stage 7: test stage\n',
+        f'{INFO} Starting Stage 7 - This is a test\n',
+        f'{INFO} Starting Stage 7: test stage - This is a test\n',
+    ]
 
 
-@freeze_time('2021-01-02 01:06:34')
-def test_basic_end_stage(capsys):
+def test_basic_end_stage(basic, capsys):
     """Verify the end_stage() method works as expected."""
-    output = Output()
-    with pytest.raises(NotImplementedError):
-        output.log(OutputMethod.STAGE_END)
-
-    output = Basic()
     # Default stage number and status.
-    output.log(OutputMethod.STAGE_END)
-    captured = capsys.readouterr()
-    assert captured.out == '2021-01-02T01:06:34 build-magic [ INFO  ] Stage 1 complete with result DONE\n'
-
+    basic.log(OutputMethod.STAGE_END)
     # Stage number but default status.
-    output.log(OutputMethod.STAGE_END, 7)
-    captured = capsys.readouterr()
-    assert captured.out == '2021-01-02T01:06:34 build-magic [ INFO  ] Stage 7 complete with result DONE\n'
-
+    basic.log(OutputMethod.STAGE_END, 7)
     # Assigned stage number and status.
-    output.log(OutputMethod.STAGE_END, 7, 1)
-    captured = capsys.readouterr()
-    assert captured.out == '2021-01-02T01:06:34 build-magic [ INFO  ] Stage 7 complete with result FAIL\n'
-
+    basic.log(OutputMethod.STAGE_END, 7, 1)
     # Assigned stage number, status, and name.
-    output.log(OutputMethod.STAGE_END, 7, 1, 'test-stage')
-    captured = capsys.readouterr()
-    assert captured.out == '2021-01-02T01:06:34 build-magic [ INFO  ] Stage 7: test-stage - complete with result FAIL\n'
-
+    basic.log(OutputMethod.STAGE_END, 7, 1, 'test-stage')
     # Stage skipped.
-    output.log(OutputMethod.STAGE_END, 7, 6)
-    captured = capsys.readouterr()
-    assert captured.out == '2021-01-02T01:06:34 build-magic [ INFO  ] Stage 7 complete with result SKIP\n'
+    basic.log(OutputMethod.STAGE_END, 7, 6)
+    assert capsys.readouterr().out.splitlines(keepends=True) == [
+        f'{INFO} Stage 1 complete with result DONE\n',
+        f'{INFO} Stage 7 complete with result DONE\n',
+        f'{INFO} Stage 7 complete with result FAIL\n',
+        f'{INFO} Stage 7: test-stage - complete with result FAIL\n',
+        f'{INFO} Stage 7 complete with result SKIP\n',
+    ]
 
 
-def test_basic_no_job(capsys):
+def test_basic_no_job(basic, capsys):
     """Verify the basic no_job() method works as expected."""
-    output = Output()
-    with pytest.raises(NotImplementedError):
-        output.log(OutputMethod.NO_JOB)
-
-    output = Basic()
-    output.log(OutputMethod.NO_JOB)
+    basic.log(OutputMethod.NO_JOB)
     captured = capsys.readouterr()
     assert captured.out == 'No commands to run. Use --help for usage. Exiting...\n'
 
 
-def test_basic_macro_start(capsys):
+def test_basic_macro_start(basic, capsys):
     """Verify the basic macro_start() method doesn't print anything."""
-    output = Output()
-    with pytest.raises(NotImplementedError):
-        output.log(OutputMethod.MACRO_START)
-
-    output = Basic()
-    output.log(OutputMethod.MACRO_START)
+    basic.log(OutputMethod.MACRO_START)
     captured = capsys.readouterr()
     assert not captured.out
     assert not captured.err
 
 
-@freeze_time('2021-01-02 01:06:34')
-def test_basic_macro_status(capsys):
+def test_basic_macro_status(basic, capsys):
     """Verify the basic macro_status() method works as expected."""
-    output = Output()
-    with pytest.raises(NotImplementedError):
-        output.log(OutputMethod.MACRO_STATUS)
-
-    output = Basic()
     # Only the directive.
-    output.log(OutputMethod.MACRO_STATUS, 'BUILD')
-    captured = capsys.readouterr()
-    assert captured.out == '2021-01-02T01:06:34 build-magic [ DONE  ] ( 1/1 ) BUILD   \n'
-
+    basic.log(OutputMethod.MACRO_STATUS, 'BUILD')
     # Default status code.
-    output.log(OutputMethod.MACRO_STATUS, 'BUILD', 'tar -czf hello.tar.gz')
-    captured = capsys.readouterr()
-    assert captured.out == '2021-01-02T01:06:34 build-magic [ DONE  ] ( 1/1 ) BUILD    : tar -czf hello.tar.gz\n'
-
+    basic.log(OutputMethod.MACRO_STATUS, 'BUILD', 'tar -czf hello.tar.gz')
     # No command but failing status code.
-    output.log(OutputMethod.MACRO_STATUS, 'BUILD', status_code=1)
-    captured = capsys.readouterr()
-    assert captured.out == '2021-01-02T01:06:34 build-magic [ FAIL  ] ( 1/1 ) BUILD   \n'
-
+    basic.log(OutputMethod.MACRO_STATUS, 'BUILD', status_code=1)
     # Command with failing status code.
-    output.log(OutputMethod.MACRO_STATUS, 'BUILD', 'tar -czf hello.tar.gz', 1)
-    captured = capsys.readouterr()
-    assert captured.out == '2021-01-02T01:06:34 build-magic [ FAIL  ] ( 1/1 ) BUILD    : tar -czf hello.tar.gz\n'
-
+    basic.log(OutputMethod.MACRO_STATUS, 'BUILD', 'tar -czf hello.tar.gz', 1)
     # Sequence of 12.
-    output.log(OutputMethod.MACRO_STATUS, directive='BUILD', command='tar -czf hello.tar.gz', sequence=12)
-    captured = capsys.readouterr()
-    assert captured.out == '2021-01-02T01:06:34 build-magic [ DONE  ] ( 12/1 ) BUILD    : tar -czf hello.tar.gz\n'
-
+    basic.log(OutputMethod.MACRO_STATUS, directive='BUILD', command='tar -czf hello.tar.gz', sequence=12)
     # Total of 42.
-    output.log(OutputMethod.MACRO_STATUS, directive='BUILD', command='tar -czf hello.tar.gz', total=42)
-    captured = capsys.readouterr()
-    assert captured.out == '2021-01-02T01:06:34 build-magic [ DONE  ] (  1/42 ) BUILD    : tar -czf hello.tar.gz\n'
-
+    basic.log(OutputMethod.MACRO_STATUS, directive='BUILD', command='tar -czf hello.tar.gz', total=42)
     # Sequence 12 of 42.
-    output.log(OutputMethod.MACRO_STATUS, directive='BUILD', command='tar -czf hello.tar.gz', sequence=12, total=42)
-    captured = capsys.readouterr()
-    assert captured.out == '2021-01-02T01:06:34 build-magic [ DONE  ] ( 12/42 ) BUILD    : tar -czf hello.tar.gz\n'
-
+    basic.log(OutputMethod.MACRO_STATUS, directive='BUILD', command='tar -czf hello.tar.gz', sequence=12, total=42)
     # Sequence 64 of 112.
-    output.log(OutputMethod.MACRO_STATUS, directive='BUILD', command='tar -czf hello.tar.gz', sequence=64, total=112)
-    captured = capsys.readouterr()
-    assert captured.out == '2021-01-02T01:06:34 build-magic [ DONE  ] (  64/112 ) BUILD    : tar -czf hello.tar.gz\n'
-
+    basic.log(OutputMethod.MACRO_STATUS, directive='BUILD', command='tar -czf hello.tar.gz', sequence=64, total=112)
     # Sequence 3 of 112.
-    output.log(OutputMethod.MACRO_STATUS, directive='BUILD', command='tar -czf hello.tar.gz', sequence=3, total=112)
-    captured = capsys.readouterr()
-    assert captured.out == '2021-01-02T01:06:34 build-magic [ DONE  ] (   3/112 ) BUILD    : tar -czf hello.tar.gz\n'
-
-
-@freeze_time('2021-01-02 01:06:34')
-def test_basic_error(capsys):
+    basic.log(OutputMethod.MACRO_STATUS, directive='BUILD', command='tar -czf hello.tar.gz', sequence=3, total=112)
+    assert capsys.readouterr().out.splitlines(keepends=True) == [
+        f'{DONE} ( 1/1 ) BUILD   \n',
+        f'{DONE} ( 1/1 ) BUILD    : tar -czf hello.tar.gz\n',
+        f'{FAIL} ( 1/1 ) BUILD   \n',
+        f'{FAIL} ( 1/1 ) BUILD    : tar -czf hello.tar.gz\n',
+        f'{DONE} ( 12/1 ) BUILD    : tar -czf hello.tar.gz\n',
+        f'{DONE} (  1/42 ) BUILD    : tar -czf hello.tar.gz\n',
+        f'{DONE} ( 12/42 ) BUILD    : tar -czf hello.tar.gz\n',
+        f'{DONE} (  64/112 ) BUILD    : tar -czf hello.tar.gz\n',
+        f'{DONE} (   3/112 ) BUILD    : tar -czf hello.tar.gz\n',
+    ]
+
+
+def test_basic_error(basic, capsys):
     """Verify the basic error() method works as expected."""
-    output = Output()
-    with pytest.raises(NotImplementedError):
-        output.log(OutputMethod.MACRO_STATUS)
-
-    output = Basic()
-    output.log(OutputMethod.ERROR, 'An error occurred.')
+    basic.log(OutputMethod.ERROR, 'An error occurred.')
     captured = capsys.readouterr()
-    assert captured.out == '2021-01-02T01:06:34 build-magic [ ERROR ] An error occurred.\n'
+    assert captured.out == f'{ERROR} An error occurred.\n'
 
 
-@freeze_time('2021-01-02 01:06:34')
-def test_basic_info(capsys):
+def test_basic_info(basic, capsys):
     """Verify the basic info() method works as expected."""
-    output = Output()
-    with pytest.raises(NotImplementedError):
-        output.log(OutputMethod.INFO)
-
-    output = Basic()
-    output.log(OutputMethod.INFO, 'This is a test.\n\n\n')
+    basic.log(OutputMethod.INFO, 'This is a test.\n\n\n')
     captured = capsys.readouterr()
-    assert captured.out == '2021-01-02T01:06:34 build-magic [ INFO  ] OUTPUT: This is a test.\n'
+    assert captured.out == f'{INFO} OUTPUT: This is a test.\n'
 
 
-@freeze_time('2021-01-02 01:06:34')
-def test_basic_skip(capsys):
+def test_basic_skip(basic, capsys):
     """Verify the basic skip() method works as expected."""
-    output = Output()
-    with pytest.raises(NotImplementedError):
-        output.log(OutputMethod.INFO)
-
-    output = Basic()
-    output.log(OutputMethod.SKIP, 'Stage skipped.\n')
+    basic.log(OutputMethod.SKIP, 'Stage skipped.\n')
     captured = capsys.readouterr()
-    assert captured.out == '2021-01-02T01:06:34 build-magic [ SKIP  ] OUTPUT: Stage skipped.\n'
+    assert captured.out == f'{SKIP} OUTPUT: Stage skipped.\n'
 
 
-@freeze_time('2022-02-17 20:28:12')
-def test_basic_working_directory(capsys):
+@travel('2022-02-17 20:28:12', tick=False)
+def test_basic_working_directory(basic, capsys):
     """Verify the basic working_directory() method works as expected."""
-    output = Output()
-    with pytest.raises(NotImplementedError):
-        output.log(OutputMethod.WORKING_DIRECTORY)
-
-    output = Basic()
-    output.log(OutputMethod.WORKING_DIRECTORY, '.')
-    captured = capsys.readouterr()
-    assert captured.out == '2022-02-17T20:28:12 build-magic [ INFO  ] Current working directory: .\n'
-
-    output.log(OutputMethod.WORKING_DIRECTORY, '/home/user/myapp')
-    captured = capsys.readouterr()
-    assert captured.out == '2022-02-17T20:28:12 build-magic [ INFO  ] Current working directory: /home/user/myapp\n'
-
-    output.log(OutputMethod.WORKING_DIRECTORY, 'C:\\Users\\Default\\myapp')
-    captured = capsys.readouterr()
-    ref = '2022-02-17T20:28:12 build-magic [ INFO  ] Current working directory: C:\\Users\\Default\\myapp\n'
-    assert captured.out == ref
+    basic.log(OutputMethod.WORKING_DIRECTORY, '.')
+    basic.log(OutputMethod.WORKING_DIRECTORY, '/home/user/myapp')
+    basic.log(OutputMethod.WORKING_DIRECTORY, 'C:\\Users\\Default\\myapp')
+    assert capsys.readouterr().out.splitlines(keepends=True) == [
+        '2022-02-17T20:28:12 build-magic [ INFO  ] Current working directory: .\n',
+        '2022-02-17T20:28:12 build-magic [ INFO  ] Current working directory: /home/user/myapp\n',
+        '2022-02-17T20:28:12 build-magic [ INFO  ] Current working directory: C:\\Users\\Default\\myapp\n',
+    ]
 
 
 def test_tty_get_width_and_height(mocker):
@@ -282,17 +229,15 @@ def test_tty_get_width_and_height(mocker):
     assert output.get_height() == 35
 
 
-@freeze_time('2021-01-02 01:06:34')
 def test_tty_start_job(capsys):
     """Verify the start_job() method works correctly."""
     output = Tty()
     output.log(OutputMethod.JOB_START)
     captured = capsys.readouterr()
-    assert f'build-magic {version}' in captured.out
-    assert 'Start time Sat Jan  2 01:06:34 2021' in captured.out
+    assert captured.out.startswith(f'build-magic {version}\n')
+    assert captured.out.endswith('Start time Sat Jan  2 01:06:34 2021\n\n')
 
 
-@freeze_time('2021-01-02 01:06:34')
 def test_tty_end_job(capsys):
     """Verify the end_job() method works correctly."""
     output = Tty()
@@ -317,24 +262,17 @@ def test_tty_end_stage(capsys):
     """Verify the end_stage() method works correctly."""
     output = Tty()
     output.log(OutputMethod.STAGE_END)
-    captured = capsys.readouterr()
-    assert captured.out == 'Stage 1 finished with result DONE\n\n'
-
     output.log(OutputMethod.STAGE_END, 7)
-    captured = capsys.readouterr()
-    assert captured.out == 'Stage 7 finished with result DONE\n\n'
-
     output.log(OutputMethod.STAGE_END, 1, 1)
-    captured = capsys.readouterr()
-    assert captured.out == 'Stage 1 finished with result FAILED\n\n'
-
     output.log(OutputMethod.STAGE_END, 1, 1, 'test-stage')
-    captured = capsys.readouterr()
-    assert captured.out == 'Stage 1: test-stage - finished with result FAILED\n\n'
-
     output.log(OutputMethod.STAGE_END, 1, 6)
-    captured = capsys.readouterr()
-    assert captured.out == 'Stage 1 finished with result SKIPPED\n\n'
+    assert capsys.readouterr().out == ''.join([
+        'Stage 1 finished with result DONE\n\n',
+        'Stage 7 finished with result DONE\n\n',
+        'Stage 1 finished with result FAILED\n\n',
+        'Stage 1: test-stage - finished with result FAILED\n\n',
+        'Stage 1 finished with result SKIPPED\n\n',
+    ])
 
 
 def test_tty_no_job(capsys):
@@ -349,40 +287,30 @@ def test_tty_macro_start(capsys):
     """Verify the macro_start() method works correctly."""
     output = Tty()
     output.log(OutputMethod.MACRO_START, 'execute', 'ls')
-    captured = capsys.readouterr()
-    assert captured.out == '( 1/1 ) EXECUTE : ls ................................................ RUNNING\n'
-
     output.log(OutputMethod.MACRO_START, 'execute')
-    captured = capsys.readouterr()
-    assert captured.out == 'EXECUTE ..................................................\n'
-
     output.log(OutputMethod.MACRO_START, 'execute', f'echo {"-" * 46}')
-    captured = capsys.readouterr()
-    assert captured.out == '( 1/1 ) EXECUTE : echo ----------------------------------------- .... RUNNING\n'
-
     output.log(OutputMethod.MACRO_START, 'execute', f'echo {"-" * 45}')
-    captured = capsys.readouterr()
-    assert captured.out == '( 1/1 ) EXECUTE : echo ---------------------------------------------  RUNNING\n'
-
     output.log(OutputMethod.MACRO_START, 'execute', f'echo {"-" * 44}')
-    captured = capsys.readouterr()
-    assert captured.out == '( 1/1 ) EXECUTE : echo -------------------------------------------- . RUNNING\n'
-
     output.log(OutputMethod.MACRO_START, 'execute', 'echo |\n')
-    captured = capsys.readouterr()
-    assert captured.out == '( 1/1 ) EXECUTE : echo | ............................................ RUNNING\n'
+    assert capsys.readouterr().out.splitlines(keepends=True) == [
+        '( 1/1 ) EXECUTE : ls ................................................ RUNNING\n',
+        'EXECUTE ..................................................\n',
+        '( 1/1 ) EXECUTE : echo ----------------------------------------- .... RUNNING\n',
+        '( 1/1 ) EXECUTE : echo ---------------------------------------------  RUNNING\n',
+        '( 1/1 ) EXECUTE : echo -------------------------------------------- . RUNNING\n',
+        '( 1/1 ) EXECUTE : echo | ............................................ RUNNING\n',
+    ]
 
 
 def test_tty_macro_status(capsys):
     """Verify the macro_status() method works correctly."""
     output = Tty()
     output.log(OutputMethod.MACRO_STATUS)
-    captured = capsys.readouterr()
-    assert captured.out == 'COMPLETE\n'
-
     output.log(OutputMethod.MACRO_STATUS, '', '', 1)
-    captured = capsys.readouterr()
-    assert captured.out == 'FAILED  \n'
+    assert capsys.readouterr().out.splitlines(keepends=True) == [
+        'COMPLETE\n',
+        'FAILED  \n',
+    ]
 
 
 def test_tty_error(capsys):
@@ -414,37 +342,19 @@ def test_tty_working_directory(capsys):
     """Verify the tty working_directory() method works correctly."""
     output = Tty()
     output.log(OutputMethod.WORKING_DIRECTORY, '.')
-    captured = capsys.readouterr()
-    assert captured.out == '=> Current working directory: .\n'
-
     output.log(OutputMethod.WORKING_DIRECTORY, '/home/user/myapp')
-    captured = capsys.readouterr()
-    assert captured.out == '=> Current working directory: /home/user/myapp\n'
-
     output.log(OutputMethod.WORKING_DIRECTORY, 'C:\\Users\\Default\\myapp')
-    captured = capsys.readouterr()
-    assert captured.out == '=> Current working directory: C:\\Users\\Default\\myapp\n'
+    assert capsys.readouterr().out.splitlines(keepends=True) == [
+        '=> Current working directory: .\n',
+        '=> Current working directory: /home/user/myapp\n',
+        '=> Current working directory: C:\\Users\\Default\\myapp\n',
+    ]
 
 
-@pytest.mark.parametrize(
-    'method', (
-        OutputMethod.JOB_START,
-        OutputMethod.JOB_END,
-        OutputMethod.STAGE_START,
-        OutputMethod.STAGE_END,
-        OutputMethod.NO_JOB,
-        OutputMethod.MACRO_START,
-        OutputMethod.MACRO_STATUS,
-        OutputMethod.ERROR,
-        OutputMethod.INFO,
-        OutputMethod.SKIP,
-        OutputMethod.PROCESS_SPINNER,
-    )
-)
-def test_silent(capsys, method):
+def test_silent(silent):
     """Verify the silent methods work correctly."""
-    output = Silent()
-    output.log(method)
-    captured = capsys.readouterr()
-    assert not captured.out
-    assert not captured.err
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(out):
+        for method in OutputMethod:
+            silent.log(method)
+    assert not out.getvalue()
@@ -89,7 +89,7 @@ def build_path(tmp_path_factory):
     """Provides a temp directory with a single file in it."""
     magic = tmp_path_factory.mktemp('build_magic')
     hello = magic / 'hello.txt'
-    hello.write_text('hello')
+    hello.write_bytes(b'hello')
     return magic
 
 
@@ -212,6 +212,7 @@ def test_local_constructor():
     assert runner.timeout == 10
 
 
+@pytest.mark.usefixtures('restore_cwd')
 def test_local_prepare(build_path, local_runner, tmp_path):
     """Verify the Local command runner prepare() method works correctly."""
     local_runner.working_directory = str(tmp_path)
@@ -305,6 +306,8 @@ def test_local_os_matches_environment_linux(local_runner, mocker, version):
     assert local_runner.os_matches_environment()
 
 
+@pytest.mark.usefixtures('restore_cwd')
+@pytest.mark.shell
 def test_local_execute(build_path, local_runner, tmp_path):
     """Verify the Local command runner execute() method works correctly."""
     cmd = Macro('tar -v -czf hello.tar.gz hello.txt')
@@ -322,8 +325,10 @@ def test_local_execute(build_path, local_runner, tmp_path):
         assert status.stderr == b'a hello.txt' + bytes(os.linesep, encoding='utf-8')
 
 
-def test_local_execute_fail(local_runner, tmp_path):
+@pytest.mark.shell
+def test_local_execute_fail(local_runner, monkeypatch, tmp_path):
     """Test the case where a Local execute() command fails."""
+    monkeypatch.chdir(tmp_path)
     cmd = Macro('tar -v -czf hello.tar.gz dummy.txt')
     local_runner.prepare()
     status = local_runner.execute(cmd)
@@ -346,6 +351,7 @@ def test_local_execute_fail(local_runner, tmp_path):
         )
 
 
+@pytest.mark.shell
 def test_local_envs(env, local_runner):
     """Verify envs passed to the Local runner are included in execute()."""
     envs = {
@@ -430,9 +436,9 @@ def test_docker_host_wd_not_found(mocker):
         assert Docker()
 
 
-def test_docker_prepare(docker_runner, build_path, mocker, tmp_path):
+def test_docker_prepare(build_path, docker_runner, mocker, monkeypatch, tmp_path):
     """Verify the Docker command runner prepare() method works correctly."""
-    os.chdir(str(tmp_path))
+    monkeypatch.chdir(tmp_path)
     container = mocker.patch('docker.models.containers.Container')
     run = mocker.patch('docker.models.containers.Container.exec_run')
     docker_runner.container = container
@@ -625,13 +631,12 @@ def test_vagrant_constructor(mocker):
     assert runner.environment == str(Path(env)) + os.sep
 
 
-def test_vagrant_create_vagrantfile_config(tmp_path):
+def test_vagrant_create_vagrantfile_config(fixture_files, tmp_path):
     """Verify that the create_config() method creates a new Vagrant file with the new config."""
-    ref_vagrantfile = Path(__file__).parent / 'files' / 'Vagrantfile'
     vagrantfile_path = tmp_path / 'vagrant_build_magic'
     vagrantfile_path.mkdir()
-    vagrantfile = ref_vagrantfile.read_text()
-    vagrantfile_path.joinpath('Vagrantfile').write_text(vagrantfile)
+    vagrantfile_path.joinpath('Vagrantfile').write_bytes(fixture_files['Vagrantfile'])
+    vagrantfile = fixture_files['Vagrantfile'].decode()
 
     runner = Vagrant(
         environment=str(vagrantfile_path),
@@ -721,11 +726,11 @@ end"""
     assert config == ref
 
 
-def test_vagrant_prepare(build_path, mocker, tmp_path, vagrant_runner):
+def test_vagrant_prepare(build_path, mocker, monkeypatch, tmp_path, vagrant_runner):
     """Verify the Vagrant command runner prepare() method works correctly."""
     ssh = mocker.patch('vagrant.Vagrant.ssh')
     vm = vagrant.Vagrant()
-    os.chdir(str(tmp_path))
+    monkeypatch.chdir(tmp_path)
 
     # Nothing to do.
     assert not vagrant_runner.prepare()
@@ -892,11 +897,11 @@ def test_remote_key_file_not_found():
         Remote('user@myhost', parameters=params)
 
 
-def test_remote_prepare(build_path, mock_key, mocker, tmp_path, remote_runner):
+def test_remote_prepare(build_path, mock_key, mocker, monkeypatch, remote_runner, tmp_path):
     """Verify the Remote command runner prepare() method works correctly."""
     mocker.patch('paramiko.SSHClient', spec=paramiko.SSHClient)
     put = mocker.patch('scp.SCPClient.put', return_value=None)
-    os.chdir(str(tmp_path))
+    monkeypatch.chdir(tmp_path)
     assert not remote_runner.prepare()
 
     assert len(list(Path.cwd().iterdir())) == 0
@@ -978,6 +983,7 @@ def test_remote_execute_fail(mock_key, mocker, remote_runner):
     assert status.exit_code == 1
 
 
+@pytest.mark.usefixtures('restore_cwd')
 def test_copy_to_working_directory(tmp_path_factory, local_runner):
     """Verify the file copy behavior works correctly when calling the runner's copy() method."""
     dir1 = tmp_path_factory.mktemp('dir1')
@@ -998,6 +1004,7 @@ def test_copy_to_working_directory(tmp_path_factory, local_runner):
     assert dir2.joinpath('plugins.cpp').exists()
 
 
+@pytest.mark.usefixtures('restore_cwd')
 def test_copy_to_working_directory_fail(tmp_path_factory, local_runner):
     """Test the case where not all files are copied from the copy directory because they don't exist."""
     dir1 = tmp_path_factory.mktemp('dir1')